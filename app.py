@@ -1,21 +1,44 @@
 # app.py
-from flask import Flask, render_template, request, redirect, url_for, session, flash
+from flask import Flask, Response, abort, jsonify, render_template, request, redirect, stream_with_context, url_for, flash
 from config import Config
+from exceptions import AuthenticationError, PasswordHashTimeout
 from models import db  # (User, Vacation, Notification 불러도 OK지만 임포트 시 DB 접근 금지)
-from services.vacation_service import VacationService
+from services.vacation_service import EXPORT_COLUMNS, VacationService
 from services.user_service import UserService
 from services.notification_service import NotificationService
 from services.auth_service import AuthService
+from services.leave_balance_service import LeaveBalanceService
+from services.calendar_service import CalendarService
 from utils.decorators import login_required, admin_required
+from utils.current_user import get_current_principal, get_current_user
+from utils.principal import end_session, start_session
+from utils.db_engine import init_db_engine
+from utils.db_routing import REPLICA_BIND, sync_sqlite_replica
+from utils.notification_broker import init_notification_broker, get_broker
+from utils.holiday_calendar import init_holiday_calendar
+from utils.password_hasher import init_password_hasher
+from utils.login_throttle import init_login_throttle, get_login_throttle
+from utils.csv_stream import iter_csv
 from utils.init_data import init_default_users   # ← 임포트만, '호출'은 하지 않음!
 from flask_migrate import Migrate                 # ← 추가
 import click
+import io
+import json
+import queue
+from itertools import chain
+import uuid
+from datetime import date
 from flask.cli import with_appcontext
 
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
     db.init_app(app)
+    init_db_engine(app)
+    init_notification_broker(app)
+    init_holiday_calendar(app)
+    init_password_hasher(app)
+    init_login_throttle(app)
     
     # with app.app_context():
     #     db.create_all()
@@ -31,17 +54,25 @@ vacation_service = VacationService()
 user_service = UserService()
 notification_service = NotificationService()
 auth_service = AuthService()
+leave_balance_service = LeaveBalanceService()
+calendar_service = CalendarService()
+
+@app.errorhandler(PasswordHashTimeout)
+def handle_password_hash_timeout(error):
+    # 해시 워커가 포화 상태: 요청 스레드를 붙잡지 않고 바로 돌려보냄
+    flash("요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.", "error")
+    return redirect(request.referrer or url_for('login'))
+
+@app.errorhandler(AuthenticationError)
+def handle_authentication_error(error):
+    # 로그인 세션의 사용자가 삭제됨: 세션은 get_current_user() 에서 이미 비움
+    return redirect(url_for('login'))
 
 @app.context_processor
 def inject_user_roles():
-    roles = []
-    username = session.get('username')
-    if username:
-        user = User.query.filter_by(username=username).first()
-        if user and user.role:
-            # 쉼표로 여러 역할이 들어갈 수 있으니 분리
-            roles = [r.strip() for r in user.role.split(',')]
-    return dict(current_user_roles=roles)
+    # 세션 principal 의 role_flags 비트마스크 → 역할명 목록 (DB 조회 없음)
+    principal = get_current_principal()
+    return dict(current_user_roles=principal.role_names if principal else [])
 
 # (선택) 시드 커맨드: 마이그레이션 후에 수동으로 초기 데이터 넣을 때 사용
 @app.cli.command("seed")
@@ -50,6 +81,88 @@ def seed_command():
     init_default_users()
     click.echo("✅ Seeded default users.")
 
+# 연차 원장 재계산: 원본 휴가 행으로부터 leave_balances를 다시 만들고 어긋난 값을 보고
+@app.cli.command("recompute-balances")
+@click.option("--chunk-size", default=500, show_default=True, help="한 번에 처리할 사용자 수")
+@click.option("--dry-run", is_flag=True, help="보고만 하고 원장은 수정하지 않음")
+@with_appcontext
+def recompute_balances_command(chunk_size, dry_run):
+    drift = leave_balance_service.recompute(chunk_size=chunk_size, dry_run=dry_run)
+    for d in drift:
+        click.echo(f"user_id={d['user_id']} year={d['leave_year']} "
+                   f"stored={d['stored']} expected={d['expected']}")
+    action = "발견" if dry_run else "수정"
+    click.echo(f"✅ 연차 원장 재계산 완료: {len(drift)}건 {action}.")
+
+# 과거 휴가 행의 applicant_user_id 채우기 (NOT NULL 마이그레이션 전에 실행, 재실행 시 이어서 처리)
+@app.cli.command("backfill-applicant-ids")
+@click.option("--chunk-size", default=1000, show_default=True, help="한 번에 커밋할 행 수")
+@with_appcontext
+def backfill_applicant_ids_command(chunk_size):
+    filled, unmatched = vacation_service.backfill_applicant_user_ids(chunk_size=chunk_size)
+    click.echo(f"✅ applicant_user_id {filled}건 채움.")
+    if unmatched:
+        click.echo(f"⚠️  신청자(username)에 해당하는 사용자가 없는 행 {len(unmatched)}건: "
+                   f"{', '.join(map(str, unmatched))}")
+
+# 미읽음 알림 카운터(users.unread_notifications) 재계산
+@app.cli.command("reconcile-unread-counts")
+@click.option("--chunk-size", default=500, show_default=True, help="한 번에 처리할 사용자 수")
+@with_appcontext
+def reconcile_unread_counts_command(chunk_size):
+    drift = notification_service.reconcile_unread_counts(chunk_size=chunk_size)
+    for d in drift:
+        click.echo(f"user_id={d['user_id']} stored={d['stored']} actual={d['actual']}")
+    click.echo(f"✅ 미읽음 카운터 {len(drift)}건 수정.")
+
+# 알림 보존 정책: 오래된 읽은 알림을 notifications_archive 로 이동 (cron 등으로 주기 실행)
+@app.cli.command("archive-notifications")
+@click.option("--days", type=int, default=None, help="보존 일수 (기본: NOTIFICATION_RETENTION_DAYS)")
+@click.option("--chunk-size", type=int, default=None, help="한 번에 옮길 행 수 (기본: NOTIFICATION_ARCHIVE_CHUNK_SIZE)")
+@with_appcontext
+def archive_notifications_command(days, chunk_size):
+    days = days if days is not None else app.config['NOTIFICATION_RETENTION_DAYS']
+    chunk_size = chunk_size or app.config['NOTIFICATION_ARCHIVE_CHUNK_SIZE']
+    moved = notification_service.archive_read_notifications(days, chunk_size=chunk_size)
+    click.echo(f"✅ {days}일 지난 읽은 알림 {moved}건을 보관 테이블로 이동했습니다.")
+
+# 사용자 일괄 등록: CSV(employee_number, username, join_date, part, role), 임시 비밀번호로 생성
+@app.cli.command("import-users")
+@click.argument("csv_file", type=click.File("r", encoding="utf-8-sig"))
+@click.option("--chunk-size", default=500, show_default=True, help="한 번에 커밋할 행 수")
+@click.option("--workers", type=int, default=None, help="비밀번호 해시 프로세스 수 (기본: PASSWORD_HASH_WORKERS)")
+@with_appcontext
+def import_users_command(csv_file, chunk_size, workers):
+    report = user_service.import_users(csv_file, chunk_size=chunk_size, hash_workers=workers)
+    for e in report['errors']:
+        click.echo(f"line {e['line']}: [{e['employee_number']}/{e['username']}] {e['message']}")
+    click.echo(f"✅ 사용자 {report['created']}명 등록, {len(report['errors'])}행 실패.")
+
+# 급여 정산용 휴가 CSV 내보내기 (기간과 겹치는 휴가, 기본은 승인 건만)
+@app.cli.command("export-vacations")
+@click.option("--from", "date_from", type=click.DateTime(formats=["%Y-%m-%d"]), default=None, help="시작일 YYYY-MM-DD")
+@click.option("--to", "date_to", type=click.DateTime(formats=["%Y-%m-%d"]), default=None, help="종료일 YYYY-MM-DD")
+@click.option("--status", default="approved", show_default=True, help="상태 (all 이면 전체)")
+@click.option("--output", "-o", type=click.File("w", encoding="utf-8-sig"), default="-", help="출력 파일 (기본: 표준 출력)")
+@with_appcontext
+def export_vacations_command(date_from, date_to, status, output):
+    rows = vacation_service.iter_vacation_export(date_from and date_from.date(), date_to and date_to.date(), status)
+    for line in iter_csv(EXPORT_COLUMNS, rows):
+        output.write(line)
+
+# 로컬 개발용 복제 대역: primary SQLite 파일을 replica(REPLICA_DATABASE_URL) 파일로 복사 (cron 등으로 주기 실행)
+@app.cli.command("sync-replica")
+@with_appcontext
+def sync_replica_command():
+    replica = db.engines.get(REPLICA_BIND)
+    if replica is None:
+        raise click.ClickException("REPLICA_DATABASE_URL 이 설정되지 않았습니다.")
+    try:
+        pages = sync_sqlite_replica(db.engine, replica)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"✅ replica 동기화 완료: {pages} 페이지 복사.")
+
 # Authentication Routes
 @app.route('/')
 @app.route('/login', methods=['GET', 'POST'])
@@ -57,11 +170,17 @@ def login():
     if request.method == 'POST':
         username = request.form['username']
         password = request.form['password']
-        
+
+        # DB 조회·비밀번호 해시 전에 시도 횟수부터 확인
+        rejected = get_login_throttle().check(username, request.remote_addr)
+        if rejected:
+            flash(f"로그인 시도가 너무 많습니다. {rejected[1]}초 후 다시 시도해 주세요.", "error")
+            return render_template('login.html'), 429, {'Retry-After': str(rejected[1])}
+
         result = auth_service.authenticate_user(username, password)
         
         if result['success']:
-            session['username'] = username
+            start_session(result['user'])
             if result['is_temp_password']:
                 flash("임시 비밀번호로 로그인하셨습니다. 새 비밀번호를 설정해주세요.", "warning")
                 return redirect(url_for('change_password'))
@@ -76,13 +195,11 @@ def login():
 @app.route('/change_password', methods=['GET', 'POST'])
 @login_required
 def change_password():
-    username = session.get('username')
-    
     if request.method == 'POST':
         new_password = request.form['new_password']
         confirm_password = request.form['confirm_password']
         
-        result = auth_service.change_password(username, new_password, confirm_password)
+        result = auth_service.change_password(get_current_user(), new_password, confirm_password)
         flash(result['message'], result['type'])
         
         if result['success']:
@@ -95,7 +212,7 @@ def change_password():
 
 @app.route('/logout')
 def logout():
-    session.pop('username', None)
+    end_session()
     return redirect(url_for('login'))
 
 
@@ -103,13 +220,12 @@ def logout():
 @app.route('/dashboard')
 @login_required
 def dashboard():
-    username = session['username']
-    user_info = user_service.get_user_by_username(username)
-    unread_count = notification_service.get_unread_count(user_info.id)
-    user_roles = user_info.role.split(',')
+    user_info = get_current_user()
+    unread_count = user_info.unread_notifications
+    user_roles = user_info.role_names
     
     return render_template('dashboard.html', 
-                           username=username, 
+                           username=user_info.username,
                            user_roles=user_roles, 
                            unread_notifications_count=unread_count)
 
@@ -118,8 +234,6 @@ def dashboard():
 @app.route('/apply', methods=['GET', 'POST'])
 @login_required
 def apply():
-    username = session['username']
-    
     if request.method == 'POST':
         vacation_data = {
             'vacation_type': request.form['vacation_type'],
@@ -129,7 +243,12 @@ def apply():
             'backup': request.form['backup']
         }
         
-        result = vacation_service.apply_vacation(username, vacation_data)
+        # 더블 클릭/재시도로 같은 폼이 다시 제출되면 처음 결과를 돌려받음
+        idempotency_key = request.headers.get('Idempotency-Key') or request.form.get('idempotency_key') or None
+        if idempotency_key and len(idempotency_key) > 64:
+            abort(400)
+
+        result = vacation_service.apply_vacation(get_current_user(), vacation_data, idempotency_key)
         flash(result['message'], result['type'])
         
         if result['success']:
@@ -137,22 +256,54 @@ def apply():
         
         return redirect(url_for('apply'))
     
-    return render_template('apply.html')
+    return render_template('apply.html', idempotency_key=uuid.uuid4().hex)
 
 
 @app.route('/history')
 @login_required
 def history():
-    username = session['username']
-    vacation_history = vacation_service.get_user_vacation_history(username)
-    return render_template('history.html', history=vacation_history)
+    page = vacation_service.get_user_vacation_history(get_current_user(), cursor=request.args.get('cursor'))
+    return render_template('history.html', history=page.items, next_cursor=page.next_cursor)
+
+
+@app.route('/calendar')
+@login_required
+def team_calendar():
+    """파트별 월간 부재 현황. ?part=&month=YYYY-MM, JSON 은 ?format=json 또는 Accept: application/json."""
+    principal = get_current_principal()
+    part = request.args.get('part') or principal.part
+    # 다른 파트는 팀장만 조회
+    if part != principal.part and not principal.is_team_leader:
+        abort(403)
+    # 없는 파트 이름은 캐시 키로 쓰지 않도록 거절
+    if part != principal.part and part not in calendar_service.get_parts():
+        abort(404)
+
+    month_arg = request.args.get('month')
+    try:
+        year, month = map(int, month_arg.split('-')) if month_arg else (date.today().year, date.today().month)
+        first_day = date(year, month, 1)
+    except ValueError:
+        abort(400)
+
+    result = calendar_service.get_month(part, year, month)
+    if request.args.get('format') == 'json' or request.accept_mimetypes.best == 'application/json':
+        return jsonify(result)
+
+    prev_month = date(year - 1, 12, 1) if month == 1 else date(year, month - 1, 1)
+    next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return render_template('calendar.html',
+                           calendar=result,
+                           first_day=first_day,
+                           prev_month=prev_month.strftime('%Y-%m'),
+                           next_month=next_month.strftime('%Y-%m'),
+                           parts=calendar_service.get_parts() if principal.is_team_leader else [part])
 
 
 @app.route('/history/cancel/<int:vacation_id>', methods=['POST'])
 @login_required
 def cancel_vacation(vacation_id):
-    username = session['username']
-    result = vacation_service.cancel_vacation(vacation_id, username)
+    result = vacation_service.cancel_vacation(vacation_id, get_current_user())
     flash(result['message'], result['type'])
     return redirect(url_for('history'))
 
@@ -161,16 +312,14 @@ def cancel_vacation(vacation_id):
 @app.route('/approvals')
 @login_required
 def approvals():
-    username = session['username']
-    approval_list = vacation_service.get_pending_approvals(username)
-    return render_template('approvals.html', approval_list=approval_list)
+    page = vacation_service.get_pending_approvals(get_current_user(), cursor=request.args.get('cursor'))
+    return render_template('approvals.html', approval_list=page.items, next_cursor=page.next_cursor)
 
 
 @app.route('/approvals/approve/<int:vacation_id>', methods=['POST'])
 @login_required
 def approve_vacation(vacation_id):
-    username = session['username']
-    result = vacation_service.approve_vacation(vacation_id, username)
+    result = vacation_service.approve_vacation(vacation_id, get_current_user())
     flash(result['message'], result['type'])
     return redirect(url_for('approvals'))
 
@@ -178,30 +327,104 @@ def approve_vacation(vacation_id):
 @app.route('/approvals/reject/<int:vacation_id>', methods=['POST'])
 @login_required
 def reject_vacation(vacation_id):
-    username = session['username']
-    result = vacation_service.reject_vacation(vacation_id, username)
+    result = vacation_service.reject_vacation(vacation_id, get_current_user())
     flash(result['message'], result['type'])
     return redirect(url_for('approvals'))
 
 
+@app.route('/approvals/bulk', methods=['POST'])
+@login_required
+def bulk_process_vacations():
+    """여러 건 일괄 승인/반려. 폼(vacation_ids, action) 또는 JSON({"ids": [...], "action": ...})."""
+    if request.is_json:
+        payload = request.get_json(silent=True) or {}
+        action = payload.get('action')
+        vacation_ids = payload.get('ids', [])
+        # 문자열·숫자 섞인 목록 등은 거절 (문자열 "123" 을 글자마다 id 로 읽지 않도록)
+        if not isinstance(vacation_ids, list) or not all(
+                isinstance(v, int) and not isinstance(v, bool) for v in vacation_ids):
+            abort(400)
+    else:
+        action = request.form.get('action')
+        try:
+            vacation_ids = [int(v) for v in request.form.getlist('vacation_ids')]
+        except ValueError:
+            abort(400)
+
+    if action not in ('approve', 'reject'):
+        abort(400)
+    # 한 번에 잠그고 처리하는 건수 제한 (요청 하나가 트랜잭션을 오래 잡지 않도록)
+    if len(vacation_ids) > app.config['BULK_APPROVAL_MAX_IDS']:
+        abort(400)
+
+    results = vacation_service.process_vacations_bulk(vacation_ids, get_current_user(), action)
+
+    if request.is_json:
+        return jsonify({'results': results})
+
+    succeeded = sum(1 for r in results if r['success'])
+    failed = len(results) - succeeded
+    label = "승인" if action == 'approve' else "반려"
+    if failed:
+        flash(f"{succeeded}건 {label}, {failed}건 처리 실패", "warning")
+    else:
+        flash(f"{succeeded}건 {label} 처리되었습니다.", "success")
+    return redirect(url_for('approvals'))
+
+
 # Notification Routes
 @app.route('/notifications')
 @login_required
 def notifications():
-    username = session['username']
-    user = user_service.get_user_by_username(username)
-    user_notifications = notification_service.get_user_notifications(user.id)
-    notification_service.mark_all_as_read(user.id)
-    
-    return render_template('notifications.html', notifications=user_notifications)
+    user_id = get_current_principal().user_id
+    page = notification_service.get_user_notifications(user_id, cursor=request.args.get('cursor'))
+    # 렌더링을 먼저 끝낸 뒤 읽음 처리(커밋 후 만료된 사용자 객체를 다시 조회하지 않도록)
+    html = render_template('notifications.html', notifications=page.items, next_cursor=page.next_cursor)
+    notification_service.mark_all_as_read(user_id)
+    return html
+
+
+@app.route('/notifications/stream')
+@login_required
+def notification_stream():
+    """미읽음 배지 실시간 갱신용 SSE. 연결 시 현재 값 1회 전송 후 브로커 이벤트만 전달(DB 조회 없음)."""
+    user = get_current_user()
+    user_id, unread = user.id, user.unread_notifications
+    broker = get_broker()
+    heartbeat = app.config['NOTIFICATION_STREAM_HEARTBEAT']
+    subscription = broker.subscribe(user_id)
+
+    def generate():
+        try:
+            yield f"event: unread\ndata: {json.dumps({'unread': unread})}\n\n"
+            while True:
+                try:
+                    payload = subscription.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: notification\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        finally:
+            broker.unsubscribe(user_id, subscription)
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 # Admin Routes
 @app.route('/admin')
 @admin_required
 def admin():
-    users = user_service.get_all_users()
-    return render_template('admin_dashboard.html', users=users)
+    page = user_service.get_all_users(cursor=request.args.get('cursor'))
+    leave_overview = leave_balance_service.get_overview(page.items)
+    return render_template('admin_dashboard.html', users=page.items, next_cursor=page.next_cursor,
+                           leave_overview=leave_overview)
+
+
+@app.route('/admin/metrics')
+@admin_required
+def admin_metrics():
+    return jsonify({'login_throttle': get_login_throttle().stats()})
 
 
 # /admin/add_user
@@ -223,6 +446,45 @@ def add_user():
     return render_template('add_user.html')
 
 
+# /admin/import_users: CSV 업로드로 일괄 등록
+@app.route('/admin/import_users', methods=['GET', 'POST'])
+@admin_required
+def import_users():
+    report = None
+    if request.method == 'POST':
+        upload = request.files.get('file')
+        if not upload or not upload.filename:
+            flash("CSV 파일을 선택해 주세요.", "error")
+            return redirect(url_for('import_users'))
+        # 업로드 스트림을 줄 단위로 읽음 (BOM 있는 엑셀 CSV 대응)
+        lines = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+        report = user_service.import_users(lines)
+        flash(f"사용자 {report['created']}명 등록, {len(report['errors'])}행 실패.",
+              "warning" if report['errors'] else "success")
+    return render_template('import_users.html', report=report)
+
+
+# /admin/export/vacations.csv?from=YYYY-MM-DD&to=YYYY-MM-DD&status=approved
+@app.route('/admin/export/vacations.csv')
+@admin_required
+def export_vacations():
+    try:
+        date_from = date.fromisoformat(request.args['from']) if request.args.get('from') else None
+        date_to = date.fromisoformat(request.args['to']) if request.args.get('to') else None
+    except ValueError:
+        abort(400)
+    status = request.args.get('status') or 'approved'
+    if status not in ('all', 'pending_part_leader', 'pending_team_leader', 'approved', 'rejected'):
+        abort(400)
+
+    rows = vacation_service.iter_vacation_export(date_from, date_to, status)
+    # 생성기가 응답을 보내는 동안 DB 세션(앱 컨텍스트)을 유지. BOM 은 엑셀 한글 표시용
+    body = stream_with_context(chain(['\ufeff'], iter_csv(EXPORT_COLUMNS, rows)))
+    filename = f"vacations_{date_from or 'all'}_{date_to or 'all'}_{status}.csv"
+    return Response(body, mimetype='text/csv',
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+
+
 # /admin/edit_user/<id>
 @app.route('/admin/edit_user/<int:user_id>', methods=['GET', 'POST'])
 @admin_required
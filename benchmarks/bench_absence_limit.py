@@ -0,0 +1,87 @@
+# benchmarks/bench_absence_limit.py
+"""파트 동시 부재 한도 검사: 날짜별 COUNT 쿼리 반복 vs 범위 쿼리 1회 + difference array.
+
+사용법: python benchmarks/bench_absence_limit.py [--members 200] [--vacations 30] [--days 14] [--repeat 100]
+"""
+import argparse
+import random
+from datetime import date, timedelta
+
+from common import measure, setup_app
+
+
+STATES = ('pending_part_leader', 'pending_team_leader', 'approved')
+
+
+def per_day_check(part, start, end, limit):
+    """비교용 단순 구현: 날짜마다 COUNT 쿼리."""
+    from models import User, Vacation, db
+    day = start
+    while day <= end:
+        count = (db.session.query(Vacation.id)
+                 .join(User, User.id == Vacation.applicant_user_id)
+                 .filter(User.part == part, Vacation.status.in_(STATES),
+                         Vacation.start_date <= day, Vacation.end_date >= day)
+                 .count())
+        if count + 1 > limit:
+            return False
+        day += timedelta(days=1)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--members', type=int, default=200)
+    parser.add_argument('--vacations', type=int, default=30, help='구성원 1인당 휴가 수')
+    parser.add_argument('--days', type=int, default=14, help='검사할 신청 기간(일)')
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args()
+
+    app = setup_app()
+    from models import User, Vacation, db
+    from services.vacation_service import VacationService
+
+    rng = random.Random(0)
+    year_start = date(2030, 1, 1)
+    with app.app_context():
+        db.session.bulk_insert_mappings(User, [
+            {'employee_number': f'B{i}', 'username': f'member{i}', 'password': 'x',
+             'join_date': date(2015, 1, 1), 'part': 'Development', 'role': '팀원',
+             'role_flags': 4, 'is_temp_password': False}
+            for i in range(args.members)
+        ])
+        user_ids = [uid for (uid,) in db.session.query(User.id)]
+        rows = []
+        for uid in user_ids:
+            for _ in range(args.vacations):
+                start = year_start + timedelta(days=rng.randrange(365))
+                rows.append({
+                    'applicant': f'member{uid}', 'applicant_user_id': uid, 'vacation_type': 'annual',
+                    'start_date': start, 'end_date': start + timedelta(days=rng.randrange(5)),
+                    'reason': 'bench', 'backup': '-', 'status': rng.choice(STATES + ('rejected',)),
+                })
+        db.session.bulk_insert_mappings(Vacation, rows)
+        db.session.commit()
+
+        # 한도를 넉넉히 두어 두 구현 모두 전 기간을 끝까지 검사하게 함
+        limit = args.members + 1
+        app.config['PART_ABSENCE_LIMITS'] = {'Development': limit}
+        service = VacationService()
+        start = date(2030, 6, 1)
+        end = start + timedelta(days=args.days - 1)
+
+        assert per_day_check('Development', start, end, limit)
+        assert service._check_part_absence_limit('Development', start, end, STATES)['success']
+
+        per_day_ms = measure(lambda: per_day_check('Development', start, end, limit), args.repeat)
+        sweep_ms = measure(lambda: service._check_part_absence_limit('Development', start, end, STATES),
+                           args.repeat)
+
+    print(f"members={args.members} vacations={len(rows)} range={args.days} days")
+    print(f"per-day COUNT : {per_day_ms:8.3f} ms/check")
+    print(f"range + sweep : {sweep_ms:8.3f} ms/check")
+    print(f"speed-up      : {per_day_ms / sweep_ms:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+# benchmarks/bench_db_profiles.py
+"""DB 엔진 프로필별 쓰기 처리량: 신청 워커 프로세스 여러 개 + 결재 프로세스 2개(파트장·팀장)가
+같은 DB에 동시에 /apply, /approvals/bulk 를 호출합니다 (gunicorn 워커 여러 개와 같은 상황).
+
+Config 는 임포트 시점에 읽히므로 프로필마다 새 프로세스로 실행합니다.
+HTTP 500(대부분 'database is locked')은 실패로 셉니다.
+
+사용법: python benchmarks/bench_db_profiles.py [--profiles plain,sqlite] [--processes 4] [--applicants 8] [--applies 30]
+        [--postgres-url postgresql://...]   # 지정하면 (비어 있는) 그 DB로 postgresql 프로필도 측정
+"""
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from common import create_user, login_as, setup_app
+
+
+def weekdays(start, count):
+    day = start
+    while count:
+        if day.weekday() < 5:
+            yield day
+            count -= 1
+        day += timedelta(days=1)
+
+
+def seed(args):
+    app = setup_app(args.db_url)
+    with app.app_context():
+        for n in range(args.applicants):
+            create_user(f'applicant{n}')
+        create_user('part_leader', role='파트장')
+        create_user('team_leader', role='팀장')
+
+
+def run_applicants(args, first, count):
+    """applicant{first}..{first+count-1} 가 스레드 하나씩 신청."""
+    app = setup_app(args.db_url)
+    app.logger.setLevel(logging.CRITICAL)  # 500 응답의 스택 트레이스 출력 생략
+    counts = {'apply_ok': 0, 'errors': 0}
+    lock = threading.Lock()
+
+    def applicant(n):
+        client = app.test_client()
+        login_as(client, f'applicant{n}')
+        for day in weekdays(date(2031, 1, 1), args.applies):
+            response = client.post('/apply', data={
+                'vacation_type': 'sick', 'start_date': day.isoformat(), 'end_date': day.isoformat(),
+                'reason': 'bench', 'backup': '-',
+            })
+            with lock:
+                counts['errors' if response.status_code >= 500 else 'apply_ok'] += 1
+
+    threads = [threading.Thread(target=applicant, args=(n,)) for n in range(first, first + count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return counts
+
+
+def run_approver(args, username, status):
+    """status 결재 대기 건을 20건씩 일괄 승인. done 파일이 생기고 대기 건이 없으면 종료."""
+    app = setup_app(args.db_url)
+    app.logger.setLevel(logging.CRITICAL)
+    from models import Vacation, db
+    counts = {'approve_ok': 0, 'errors': 0}
+    client = app.test_client()
+    login_as(client, username)
+    while True:
+        done = os.path.exists(args.done_file)
+        with app.app_context():
+            ids = [vid for (vid,) in db.session.query(Vacation.id)
+                   .filter(Vacation.status == status).order_by(Vacation.id).limit(20)]
+        if ids:
+            response = client.post('/approvals/bulk', json={'ids': ids, 'action': 'approve'})
+            if response.status_code >= 500:
+                counts['errors'] += 1
+            else:
+                counts['approve_ok'] += sum(r['success'] for r in response.get_json()['results'])
+        elif done:
+            return counts
+        else:
+            time.sleep(0.01)
+
+
+def run_profile(args, profile):
+    """프로필 하나: 시드 후 신청 프로세스 --processes 개 + 결재 프로세스 2개를 동시에 실행."""
+    workdir = tempfile.mkdtemp(prefix='vacation_bench_')
+    db_url = args.postgres_url if profile == 'postgresql' else 'sqlite:///' + os.path.join(workdir, 'bench.db')
+    done_file = os.path.join(workdir, 'done')
+    env = {**os.environ, 'DB_PROFILE': profile}
+    base = [sys.executable, __file__, '--db-url', db_url, '--done-file', done_file,
+            '--applicants', str(args.applicants), '--applies', str(args.applies)]
+    subprocess.run(base + ['--child', 'seed'], env=env, check=True)
+
+    per_process = -(-args.applicants // args.processes)
+    roles = [f'applicants:{first}:{min(per_process, args.applicants - first)}'
+             for first in range(0, args.applicants, per_process)]
+    started = time.perf_counter()
+    approvers = [subprocess.Popen(base + ['--child', role], env=env, stdout=subprocess.PIPE, text=True)
+                 for role in ('approver:part_leader:pending_part_leader', 'approver:team_leader:pending_team_leader')]
+    applicants = [subprocess.Popen(base + ['--child', role], env=env, stdout=subprocess.PIPE, text=True)
+                  for role in roles]
+    totals = {'apply_ok': 0, 'approve_ok': 0, 'errors': 0}
+    for proc in applicants:
+        for key, value in json.loads(proc.communicate()[0].strip().splitlines()[-1]).items():
+            totals[key] += value
+    open(done_file, 'w').close()
+    for proc in approvers:
+        for key, value in json.loads(proc.communicate()[0].strip().splitlines()[-1]).items():
+            totals[key] += value
+    totals['seconds'] = time.perf_counter() - started
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--profiles', default='plain,sqlite')
+    parser.add_argument('--processes', type=int, default=4, help='신청 워커 프로세스 수')
+    parser.add_argument('--applicants', type=int, default=8)
+    parser.add_argument('--applies', type=int, default=30, help='신청자 1명당 신청 수')
+    parser.add_argument('--postgres-url')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--db-url', help=argparse.SUPPRESS)
+    parser.add_argument('--done-file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        role, *params = args.child.split(':')
+        if role == 'seed':
+            seed(args)
+            return
+        if role == 'applicants':
+            counts = run_applicants(args, int(params[0]), int(params[1]))
+        else:
+            counts = run_approver(args, *params)
+        print(json.dumps(counts))
+        return
+
+    profiles = args.profiles.split(',') + (['postgresql'] if args.postgres_url else [])
+    print(f"processes={args.processes} applicants={args.applicants} applies/applicant={args.applies} "
+          f"(+ 파트장·팀장 결재 프로세스)")
+    for profile in profiles:
+        r = run_profile(args, profile)
+        writes = r['apply_ok'] + r['approve_ok']
+        print(f"{profile:<11} {writes / r['seconds']:7.1f} writes/s  apply={r['apply_ok']:<5} "
+              f"approve={r['approve_ok']:<5} http_500={r['errors']:<4} {r['seconds']:6.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# benchmarks/bench_entitlements.py
+"""연차 부여일수 계산: 사용자별 calculate_annual_leave 반복 vs calculate_annual_leave_batch.
+
+기준일 여러 개(월말·윤년·연초 포함)에 대해 두 구현의 결과가 모두 같은지도 확인합니다.
+
+사용법: python benchmarks/bench_entitlements.py [--employees 100000] [--repeat 5]
+"""
+import argparse
+import random
+from datetime import date, timedelta
+
+import numpy as np
+
+from common import measure
+
+from utils.vacation_calculator import VacationCalculator
+
+
+AS_OF_DATES = (date(2024, 2, 29), date(2024, 12, 31), date(2025, 1, 1), date(2025, 3, 31),
+               date(2025, 5, 31), date(2026, 10, 18))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--employees', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    first = date(1990, 1, 1)
+    span = (date(2026, 12, 31) - first).days
+    join_dates = [first + timedelta(days=rng.randrange(span)) for _ in range(args.employees)]
+    calc = VacationCalculator()
+
+    for as_of in AS_OF_DATES:
+        expected = [calc.calculate_annual_leave(d, as_of) for d in join_dates]
+        actual = calc.calculate_annual_leave_batch(join_dates, as_of).tolist()
+        mismatches = sum(1 for e, a in zip(expected, actual) if e != a)
+        assert mismatches == 0, f"{as_of}: {mismatches} mismatches"
+
+    as_of = AS_OF_DATES[-1]
+    scalar_ms = measure(lambda: [calc.calculate_annual_leave(d, as_of) for d in join_dates], args.repeat)
+    batch_ms = measure(lambda: calc.calculate_annual_leave_batch(join_dates, as_of), args.repeat)
+    # 입사일을 이미 datetime64 배열로 들고 있는 경우(연말 일괄 계산 등) 변환 비용 제외
+    join_array = np.array([d.isoformat() for d in join_dates], dtype='datetime64[D]')
+    array_ms = measure(lambda: calc.calculate_annual_leave_batch(join_array, as_of), args.repeat)
+
+    print(f"employees    : {args.employees} (results identical on {len(AS_OF_DATES)} as-of dates)")
+    print(f"scalar loop  : {scalar_ms:8.2f} ms")
+    print(f"numpy batch  : {batch_ms:8.2f} ms ({scalar_ms / batch_ms:.1f}x, date 리스트 입력)")
+    print(f"numpy batch  : {array_ms:8.2f} ms ({scalar_ms / array_ms:.1f}x, datetime64 배열 입력)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# benchmarks/bench_export.py
+"""휴가 CSV 내보내기: 전체를 .all() 로 읽어 CSV 를 만드는 방식 vs yield_per 스트리밍의 최대 메모리.
+
+사용법: python benchmarks/bench_export.py [--users 2000] [--vacations 50]
+"""
+import argparse
+import csv
+import io
+import tracemalloc
+from datetime import date, timedelta
+
+from common import setup_app
+
+
+def buffered_export(service_module):
+    """비교용: 조인 결과 전체를 리스트로 읽고 CSV 문자열을 한 번에 만듦."""
+    from models import User, Vacation, db
+    rows = (db.session.query(Vacation, User).join(User, User.id == Vacation.applicant_user_id)
+            .filter(Vacation.status == 'approved')
+            .order_by(Vacation.start_date, Vacation.id).all())
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(service_module.EXPORT_COLUMNS)
+    for v, u in rows:
+        writer.writerow((v.id, u.employee_number, u.username, u.part, v.vacation_type,
+                         v.start_date.isoformat(), v.end_date.isoformat(), 0, v.status))
+    return len(buffer.getvalue())
+
+
+def streamed_export(service):
+    from services.vacation_service import EXPORT_COLUMNS
+    from utils.csv_stream import iter_csv
+    return sum(len(line) for line in iter_csv(EXPORT_COLUMNS, service.iter_vacation_export()))
+
+
+def peak(fn):
+    from models import db
+    db.session.expunge_all()
+    tracemalloc.start()
+    fn()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--vacations', type=int, default=50)
+    args = parser.parse_args()
+
+    app = setup_app()
+    from models import User, Vacation, db
+    import services.vacation_service as service_module
+
+    with app.app_context():
+        db.session.bulk_insert_mappings(User, [
+            {'employee_number': f'B{i}', 'username': f'member{i}', 'password': 'x',
+             'join_date': date(2015, 1, 1), 'part': f'Part{i % 20}', 'role': '팀원',
+             'role_flags': 4, 'is_temp_password': False}
+            for i in range(args.users)
+        ])
+        user_ids = [uid for (uid,) in db.session.query(User.id)]
+        start = date(2020, 1, 6)
+        for uid in user_ids:
+            db.session.bulk_insert_mappings(Vacation, [
+                {'applicant': f'member{uid}', 'applicant_user_id': uid, 'vacation_type': 'annual',
+                 'start_date': start + timedelta(days=7 * i), 'end_date': start + timedelta(days=7 * i + 2),
+                 'reason': 'bench', 'backup': '-', 'status': 'approved'}
+                for i in range(args.vacations)
+            ])
+        db.session.commit()
+
+        service = service_module.VacationService()
+        buffered_peak = peak(lambda: buffered_export(service_module))
+        streamed_peak = peak(lambda: streamed_export(service))
+
+    print(f"rows={args.users * args.vacations}")
+    print(f"buffered (.all) : peak {buffered_peak / 1024 / 1024:8.2f} MiB")
+    print(f"streamed (yield): peak {streamed_peak / 1024 / 1024:8.2f} MiB")
+
+
+if __name__ == '__main__':
+    main()
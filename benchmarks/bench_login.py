@@ -0,0 +1,85 @@
+# benchmarks/bench_login.py
+"""로그인 처리량: 해시 워커 수별로 동시 로그인 요청을 보내 초당 처리 수와 지연 시간을 잽니다.
+
+workers=0 은 요청 스레드에서 직접 해시하는 기존 방식입니다. CPU 코어 수보다 워커가 많으면 이득이 없습니다.
+
+사용법: python benchmarks/bench_login.py [--workers 0,1,2,4] [--clients 8] [--logins 40]
+"""
+import argparse
+import statistics
+import sys
+import threading
+import time
+
+from werkzeug.security import generate_password_hash
+
+from common import create_user, setup_app
+
+
+def run(app, clients, logins):
+    """clients 개 스레드가 합쳐서 logins 번 로그인. (초당 처리 수, p50 ms, p95 ms, 실패 수)"""
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+    remaining = iter(range(logins))
+
+    def worker(n):
+        client = app.test_client()
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            started = time.perf_counter()
+            response = client.post('/login', data={'username': f'login{n}', 'password': 'Passw0rd!'})
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                latencies.append(elapsed)
+                if not response.headers.get('Location', '').endswith('/dashboard'):
+                    failures.append(response.status_code)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    total = time.perf_counter() - started
+    latencies.sort()
+    return (len(latencies) / total, statistics.median(latencies),
+            latencies[int(len(latencies) * 0.95) - 1], failures)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', default='0,1,2,4')
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--logins', type=int, default=40)
+    args = parser.parse_args()
+
+    app = setup_app()
+    from utils.login_throttle import MemoryLoginThrottle
+    from utils.password_hasher import PasswordHasher
+
+    method = app.config['PASSWORD_HASH_METHOD']
+    with app.app_context():
+        from models import db
+        hashed = generate_password_hash('Passw0rd!', method)
+        for n in range(args.clients):
+            user = create_user(f'login{n}')
+            user.password = hashed
+        db.session.commit()
+
+    print(f"method={method} clients={args.clients} logins={args.logins}")
+    unlimited = (10 ** 9, 10 ** 9)
+    for workers in (int(w) for w in args.workers.split(',')):
+        app.extensions['password_hasher'] = PasswordHasher(method, workers, timeout=60)
+        # 같은 아이디로 반복 로그인하므로 시도 제한을 끄지 않으면 해시 대신 429 거절 속도를 재게 됨
+        app.extensions['login_throttle'] = MemoryLoginThrottle(unlimited, unlimited)
+        rate, p50, p95, failures = run(app, args.clients, args.logins)
+        if failures:
+            sys.exit(f"workers={workers}: 로그인 실패 {len(failures)}건 (HTTP {sorted(set(failures))})")
+        print(f"workers={workers:<2} {rate:7.2f} logins/s  p50={p50:8.1f} ms  p95={p95:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
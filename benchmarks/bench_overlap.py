@@ -0,0 +1,76 @@
+# benchmarks/bench_overlap.py
+"""기간 중복 검사: 기존(전체 로드 후 Python 순회) vs 단일 EXISTS 쿼리.
+
+사용법: python benchmarks/bench_overlap.py [--rows 5000] [--repeat 200]
+"""
+import argparse
+from datetime import date, timedelta
+
+from common import create_user, measure, setup_app
+
+
+def legacy_check(user, new_start, new_end):
+    """이전 구현: 사용자의 모든 휴가를 읽어 Python에서 겹침을 찾음."""
+    from sqlalchemy import or_
+    from models import Vacation
+    rows = (Vacation.query
+            .filter(or_(Vacation.applicant_user_id == user.id,
+                        Vacation.applicant == user.username))
+            .all())
+    for v in rows:
+        if v.status in ('pending_part_leader', 'pending_team_leader', 'approved'):
+            if not (new_end < v.start_date or new_start > v.end_date):
+                return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    app = setup_app()
+    from models import Vacation, db
+    from services.vacation_service import VacationService
+
+    with app.app_context():
+        user = create_user('bench_user')
+        statuses = ('approved', 'rejected', 'approved', 'pending_team_leader')
+        start = date(2000, 1, 1)
+        db.session.bulk_insert_mappings(Vacation, [
+            {
+                'applicant': user.username,
+                'applicant_user_id': user.id,
+                'vacation_type': 'annual',
+                'start_date': start + timedelta(days=2 * i),
+                'end_date': start + timedelta(days=2 * i),
+                'reason': 'bench',
+                'backup': '-',
+                'status': statuses[i % len(statuses)],
+            }
+            for i in range(args.rows)
+        ])
+        db.session.commit()
+
+        service = VacationService()
+        # 겹치지 않는 미래 기간: 두 구현 모두 전체 이력을 고려해야 하는 최악의 경우
+        new_start = date(2099, 1, 1)
+        new_end = new_start + timedelta(days=4)
+
+        assert legacy_check(user, new_start, new_end)
+        assert service._check_vacation_overlap(user, new_start, new_end)['success']
+
+        legacy_ms = measure(lambda: (legacy_check(user, new_start, new_end), db.session.expunge_all()),
+                            args.repeat)
+        exists_ms = measure(lambda: service._check_vacation_overlap(user, new_start, new_end),
+                            args.repeat)
+
+    print(f"history rows : {args.rows}")
+    print(f"legacy scan  : {legacy_ms:8.3f} ms/check")
+    print(f"EXISTS query : {exists_ms:8.3f} ms/check")
+    print(f"speed-up     : {legacy_ms / exists_ms:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/bench_page_load.py
+"""/dashboard, /admin 한 번 렌더링 시 SQL 쿼리 수와 메모리 사용량(tracemalloc peak) 측정.
+
+사용법: python benchmarks/bench_page_load.py [--users 300] [--vacations 50] [--notifications 100]
+"""
+import argparse
+import tracemalloc
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from common import login_as, setup_app
+
+
+def seed(users, vacations, notifications):
+    from constants import RoleFlag
+    from models import Notification, User, Vacation, db
+    db.session.bulk_insert_mappings(User, [
+        {
+            'employee_number': f"B{i:06d}",
+            'username': 'admin' if i == 0 else f"user{i}",
+            'password': 'x',
+            'join_date': date(2015, 1, 1),
+            'part': 'Development',
+            'role': '팀장' if i == 0 else '팀원',
+            'role_flags': RoleFlag.TEAM_LEADER if i == 0 else RoleFlag.MEMBER,
+            'is_temp_password': False,
+        }
+        for i in range(users)
+    ])
+    db.session.commit()
+
+    user_rows = db.session.query(User.id, User.username).all()
+    start = date(2000, 1, 1)
+    db.session.bulk_insert_mappings(Vacation, [
+        {
+            'applicant': username,
+            'applicant_user_id': user_id,
+            'vacation_type': 'annual',
+            'start_date': start + timedelta(days=3 * j),
+            'end_date': start + timedelta(days=3 * j),
+            'reason': 'bench',
+            'backup': '-',
+            'status': 'approved',
+        }
+        for user_id, username in user_rows for j in range(vacations)
+    ])
+    db.session.bulk_insert_mappings(Notification, [
+        {'user_id': user_id, 'message': 'bench notification', 'is_read': True}
+        for user_id, _ in user_rows for _ in range(notifications)
+    ])
+    db.session.commit()
+
+
+def profile(app, client, path):
+    from models import db
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', count)
+    tracemalloc.start()
+    try:
+        response = client.get(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        event.remove(engine, 'before_cursor_execute', count)
+    assert response.status_code == 200, (path, response.status_code)
+    return len(statements), peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=300)
+    parser.add_argument('--vacations', type=int, default=50)
+    parser.add_argument('--notifications', type=int, default=100)
+    args = parser.parse_args()
+
+    app = setup_app()
+    with app.app_context():
+        seed(args.users, args.vacations, args.notifications)
+
+    client = app.test_client()
+    login_as(client, 'admin')
+
+    print(f"users={args.users} vacations/user={args.vacations} notifications/user={args.notifications}")
+    for path in ('/dashboard', '/admin'):
+        queries, peak = profile(app, client, path)
+        print(f"{path:<12} queries={queries:<4} peak_memory={peak / 1024 / 1024:8.2f} MiB")
+
+
+if __name__ == '__main__':
+    main()
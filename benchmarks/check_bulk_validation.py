@@ -0,0 +1,78 @@
+# benchmarks/check_bulk_validation.py
+"""/approvals/bulk 입력 검증 확인.
+
+- JSON ids 가 목록이 아니거나(문자열 "123" 등) 정수가 아닌 값이 섞이면 400, 아무 건도 처리하지 않음
+- BULK_APPROVAL_MAX_IDS 를 넘는 건수는 JSON·폼 모두 400
+- 한도 이내의 정상 요청은 200
+하나라도 어긋나면 종료 코드 1.
+
+사용법: python benchmarks/check_bulk_validation.py
+"""
+import sys
+from datetime import date, timedelta
+
+from common import create_user, login_as, setup_app
+
+
+def seed():
+    from models import Vacation, db
+
+    applicant = create_user('applicant')
+    create_user('team_leader', role='팀장')
+    day = date.today() + timedelta(days=30)
+    vacation = Vacation(
+        applicant_user_id=applicant.id,
+        applicant=applicant.username,
+        vacation_type='am_half_day',
+        start_date=day,
+        end_date=day,
+        reason='check',
+        backup='-',
+        status='pending_team_leader',
+    )
+    db.session.add(vacation)
+    db.session.commit()
+    return vacation.id
+
+
+def main():
+    app = setup_app()
+    with app.app_context():
+        vid = seed()
+    limit = app.config['BULK_APPROVAL_MAX_IDS']
+    client = app.test_client()
+    login_as(client, 'team_leader')
+
+    cases = [
+        ('JSON ids 가 문자열', dict(json={'ids': str(vid), 'action': 'reject'}), 400),
+        ('JSON ids 에 문자열 섞임', dict(json={'ids': [vid, str(vid)], 'action': 'reject'}), 400),
+        ('JSON ids 에 bool', dict(json={'ids': [True], 'action': 'reject'}), 400),
+        ('JSON ids 가 객체', dict(json={'ids': {'0': vid}, 'action': 'reject'}), 400),
+        (f'JSON ids {limit + 1}건', dict(json={'ids': list(range(1, limit + 2)), 'action': 'reject'}), 400),
+        (f'폼 vacation_ids {limit + 1}건',
+         dict(data={'vacation_ids': [str(n) for n in range(1, limit + 2)], 'action': 'reject'}), 400),
+        ('폼 vacation_ids 숫자 아님', dict(data={'vacation_ids': ['x'], 'action': 'reject'}), 400),
+        (f'JSON ids {limit}건', dict(json={'ids': [vid] + list(range(10**6, 10**6 + limit - 1)),
+                                         'action': 'approve'}), 200),
+    ]
+    failures = []
+    for label, kwargs, expected in cases:
+        status = client.post('/approvals/bulk', **kwargs).status_code
+        print(f"{label:<28} {status} (expected {expected})")
+        if status != expected:
+            failures.append(label)
+
+    from models import Vacation, db
+    with app.app_context():
+        status = db.session.get(Vacation, vid).status
+    # 거절된 요청들은 아무것도 바꾸지 않았고, 마지막 정상 요청만 승인했어야 함
+    if status != 'approved':
+        failures.append(f'최종 상태 {status}')
+
+    if failures:
+        sys.exit("FAIL: " + ", ".join(failures))
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
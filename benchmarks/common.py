@@ -0,0 +1,66 @@
+# benchmarks/common.py
+"""벤치마크 공용 헬퍼: 임시 SQLite DB로 앱을 띄우고 시간을 잽니다.
+
+app 모듈은 임포트 시점에 Config를 읽으므로 반드시 setup_app()을 먼저 호출한 뒤
+서비스/모델을 임포트해야 합니다.
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def setup_app(db_url=None):
+    """임시 DB(또는 지정한 URL)로 app을 만들고 테이블을 생성합니다."""
+    if db_url is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix='vacation_bench_'), 'bench.db')
+        db_url = 'sqlite:///' + db_path
+    os.environ['DATABASE_URL'] = db_url
+
+    from app import app
+    from models import db
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def create_user(username, part='Development', role='팀원', join_date=date(2015, 1, 1)):
+    from models import User, db
+    user = User(
+        employee_number=f"B{username}",
+        username=username,
+        password='x',
+        join_date=join_date,
+        part=part,
+        role=role,
+        is_temp_password=False,
+    )
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def login_as(client, username):
+    """테스트 클라이언트 세션에 username 의 principal 을 넣습니다 (로그인 요청·비밀번호 해시 생략)."""
+    from models import User
+    from utils.principal import SESSION_KEY, Principal
+    with client.application.app_context():
+        user = User.query.filter_by(username=username).one()
+        principal = Principal.from_user(user)
+    with client.session_transaction() as session:
+        session[SESSION_KEY] = list(principal)
+        session['username'] = username
+
+
+def measure(fn, repeat=200):
+    """fn을 repeat번 실행해 1회 평균(ms)을 반환합니다."""
+    fn()  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) * 1000 / repeat
@@ -0,0 +1,244 @@
+# benchmarks/stress_transitions.py
+"""결재 상태 전이 동시성 스트레스 테스트.
+
+같은 결재 대기 건을 여러 결재자(팀장 승인 / 다른 팀장 반려 / 파트장 반려)가 동시에 처리하게 하고
+건마다 정확히 한 명만 성공했는지, 최종 상태·신청자 알림·연차 원장이 승자의 처리와 맞는지 확인합니다.
+
+이어서 동시 부재 한도 1명인 파트(Capped)에서
+- 같은 날짜의 서로 다른 구성원 휴가 2건을 두 팀장이 동시에 최종 승인
+- 구성원 2명이 같은 날짜로 동시에 신청
+하고 날짜별 승인/진행 중 인원이 한도를 넘지 않는지 확인합니다.
+하나라도 어긋나면(lost update, 한도 초과) 종료 코드 1.
+
+사용법: python benchmarks/stress_transitions.py [--vacations 200] [--rounds 3] [--cap-pairs 20]
+"""
+import argparse
+import sys
+import threading
+from collections import Counter
+from datetime import date, timedelta
+
+from common import create_user, login_as, setup_app
+
+
+CAP_PART = 'Capped'
+ACTIVE_STATES = ('pending_part_leader', 'pending_team_leader', 'approved')
+
+RACERS = (
+    ('leader_a', 'approve'),
+    ('leader_b', 'reject'),
+    ('part_leader', 'reject'),
+)
+
+
+def seed(count):
+    from models import Vacation, db
+    from services.leave_balance_service import LeaveBalanceService
+
+    applicant = create_user('applicant', join_date=date(2010, 1, 1))
+    create_user('leader_a', role='팀장')
+    create_user('leader_b', role='팀장')
+    create_user('part_leader', role='파트장')
+
+    ledger = LeaveBalanceService()
+    start = date.today() + timedelta(days=30)
+    ids = []
+    for i in range(count):
+        day = start + timedelta(days=i)
+        vacation = Vacation(
+            applicant_user_id=applicant.id,
+            applicant=applicant.username,
+            vacation_type='am_half_day',
+            start_date=day,
+            end_date=day,
+            reason='stress',
+            backup='-',
+            status='pending_team_leader',
+        )
+        db.session.add(vacation)
+        ledger.add_vacation(applicant.id, vacation)
+        db.session.flush()
+        ids.append(vacation.id)
+    db.session.commit()
+    return applicant.id, ids
+
+
+def race(app, vacation_ids):
+    """결재자마다 스레드 하나. 건마다 Barrier 로 출발을 맞춰 충돌을 최대한 유도합니다."""
+    barrier = threading.Barrier(len(RACERS))
+    outcomes = {vid: [] for vid in vacation_ids}
+    errors = []
+    lock = threading.Lock()
+
+    def worker(username, action):
+        client = app.test_client()
+        login_as(client, username)
+        for vid in vacation_ids:
+            barrier.wait()
+            response = client.post('/approvals/bulk', json={'ids': [vid], 'action': action})
+            with lock:
+                if response.status_code != 200:
+                    errors.append((username, vid, response.status_code))
+                    continue
+                result = response.get_json()['results'][0]
+                outcomes[vid].append((username, action, result))
+
+    threads = [threading.Thread(target=worker, args=racer) for racer in RACERS]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return outcomes, errors
+
+
+def verify(applicant_id, outcomes):
+    from models import Notification, Vacation, db
+    from services.leave_balance_service import LeaveBalanceService
+
+    problems = []
+    conflicts = 0
+    statuses = dict(db.session.query(Vacation.id, Vacation.status)
+                    .filter(Vacation.id.in_(list(outcomes))).all())
+    for vid, attempts in outcomes.items():
+        winners = [(u, a) for u, a, r in attempts if r['success']]
+        conflicts += sum(1 for _, _, r in attempts if r.get('conflict'))
+        if len(winners) != 1:
+            problems.append(f"vacation {vid}: 성공 {len(winners)}건 {winners}")
+            continue
+        expected = 'approved' if winners[0][1] == 'approve' else 'rejected'
+        if statuses[vid] != expected:
+            problems.append(f"vacation {vid}: 승자 {winners[0]} 인데 상태는 {statuses[vid]}")
+
+    # 신청자에게는 건마다 정확히 한 번(승인 또는 반려) 알림이 가야 함
+    notified = db.session.query(Notification).filter_by(user_id=applicant_id).count()
+    if notified != len(outcomes):
+        problems.append(f"신청자 알림 {notified}건 (기대값 {len(outcomes)})")
+
+    drift = LeaveBalanceService().recompute(dry_run=True)
+    if drift:
+        problems.append(f"연차 원장 불일치: {drift}")
+    return problems, conflicts, Counter(statuses.values())
+
+
+def future_weekdays(count, offset=60):
+    day = date.today() + timedelta(days=offset)
+    days = []
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def seed_cap(count):
+    """Capped 파트 구성원 2명의 같은 날짜 결재 대기 건 count 쌍 + 동시 신청용 날짜 count 개."""
+    from models import Vacation, db
+
+    members = [create_user(f'cap_member{n}', part=CAP_PART, join_date=date(2010, 1, 1)) for n in range(2)]
+    days = future_weekdays(count * 2)
+    pairs = []
+    for day in days[:count]:
+        pair = []
+        for member in members:
+            vacation = Vacation(applicant_user_id=member.id, applicant=member.username, vacation_type='sick',
+                                start_date=day, end_date=day, reason='stress', backup='-',
+                                status='pending_team_leader')
+            db.session.add(vacation)
+            db.session.flush()
+            pair.append(vacation.id)
+        pairs.append(pair)
+    db.session.commit()
+    return [m.username for m in members], pairs, days[count:]
+
+
+def race_cap(app, usernames, pairs, apply_days):
+    """두 팀장이 쌍의 각 건을 동시에 승인하고, 두 구성원이 같은 날짜로 동시에 신청. HTTP 오류 목록 반환."""
+    errors = []
+    lock = threading.Lock()
+
+    def run(jobs):
+        barrier = threading.Barrier(len(jobs))
+
+        def worker(username, requests):
+            client = app.test_client()
+            login_as(client, username)
+            for request in requests:
+                barrier.wait()
+                response = request(client)
+                if response.status_code >= 500:
+                    with lock:
+                        errors.append((username, response.status_code))
+
+        threads = [threading.Thread(target=worker, args=job) for job in jobs]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def approve(vid):
+        return lambda client: client.post('/approvals/bulk', json={'ids': [vid], 'action': 'approve'})
+
+    def apply(day):
+        return lambda client: client.post('/apply', data={
+            'vacation_type': 'sick', 'start_date': day.isoformat(), 'end_date': day.isoformat(),
+            'reason': 'stress', 'backup': '-'})
+
+    run([('leader_a', [approve(a) for a, _ in pairs]), ('leader_b', [approve(b) for _, b in pairs])])
+    run([(username, [apply(day) for day in apply_days]) for username in usernames])
+    return errors
+
+
+def verify_cap(pairs, apply_days):
+    from models import User, Vacation, db
+
+    rows = (db.session.query(Vacation.start_date, Vacation.status)
+            .join(User, User.id == Vacation.applicant_user_id)
+            .filter(User.part == CAP_PART, Vacation.status.in_(ACTIVE_STATES)).all())
+    approved = Counter(day for day, status in rows if status == 'approved')
+    active = Counter(day for day, _ in rows)
+    problems = [f"{day}: 승인 {n}명 (한도 1)" for day, n in sorted(approved.items()) if n > 1]
+    problems += [f"{day}: 신청 {active[day]}건 진행 중 (한도 1)" for day in apply_days if active[day] > 1]
+    return problems, sum(approved.values()), sum(active[day] for day in apply_days)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--vacations', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--cap-pairs', type=int, default=20, help='동시 부재 한도 검사용 같은 날짜 휴가 쌍 수')
+    args = parser.parse_args()
+
+    app = setup_app()
+    app.config['PART_ABSENCE_LIMITS'] = {CAP_PART: 1}
+    failed = False
+    for round_no in range(1, args.rounds + 1):
+        from models import db
+        with app.app_context():
+            if round_no > 1:
+                db.drop_all()
+                db.create_all()
+            applicant_id, ids = seed(args.vacations)
+            cap_members, pairs, apply_days = seed_cap(args.cap_pairs)
+
+        outcomes, errors = race(app, ids)
+        cap_errors = race_cap(app, cap_members, pairs, apply_days)
+
+        with app.app_context():
+            problems, conflicts, statuses = verify(applicant_id, outcomes)
+            cap_problems, cap_approved, cap_applied = verify_cap(pairs, apply_days)
+        print(f"round {round_no}: vacations={len(ids)} conflicts={conflicts} "
+              f"http_errors={len(errors)} final={dict(statuses)}")
+        print(f"  part cap: pairs={len(pairs)} approved={cap_approved} "
+              f"apply_days={len(apply_days)} applied={cap_applied} http_errors={len(cap_errors)}")
+        problems += cap_problems
+        errors += cap_errors
+        for problem in problems[:10] + [f"HTTP {e}" for e in errors[:10]]:
+            print(f"  !! {problem}")
+        failed = failed or bool(problems or errors)
+
+    print("FAIL: lost update·한도 초과 발견" if failed else "OK: lost update·한도 초과 0건")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,99 @@
 # config.py
+import json
 import os
 
 
+# DB 엔진 프로필: DB_PROFILE 로 고르며, 미설정 시 DATABASE_URL 의 종류로 정함
+# - plain: 드라이버 기본값 (비교용)
+# - sqlite: 연결마다 SQLITE_PRAGMAS 적용 (WAL 로 읽기와 쓰기가 서로 막지 않음)
+# - postgresql: 커넥션 풀 크기, 끊긴 연결 확인(pre-ping), 문장 실행 제한 시간
+DB_ENGINE_PROFILES = {
+    'plain': {},
+    'sqlite': {},
+    'postgresql': {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE') or 10),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW') or 20),
+        'pool_timeout': 10,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+        'connect_args': {'options': f"-c statement_timeout={int(os.environ.get('DB_STATEMENT_TIMEOUT_MS') or 5000)}"},
+    },
+}
+
+
+def _default_db_profile(uri):
+    for name in ('sqlite', 'postgresql'):
+        if uri.startswith(name):
+            return name
+    return 'plain'
+
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'your_secret_key'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///site.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # 읽기 전용 복제본: 설정 시 @read_only 서비스 조회를 이 DB로 보냄. 쓰기를 커밋한 브라우저 세션은
+    # REPLICA_STICKY_SECONDS 동안 primary 에서 읽음 (로컬 SQLite 복제본은 `flask sync-replica` 로 갱신)
+    REPLICA_DATABASE_URL = os.environ.get('REPLICA_DATABASE_URL')
+    SQLALCHEMY_BINDS = {'replica': REPLICA_DATABASE_URL} if REPLICA_DATABASE_URL else {}
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS') or 10)
+
+    DB_PROFILE = os.environ.get('DB_PROFILE') or _default_db_profile(SQLALCHEMY_DATABASE_URI)
+    SQLALCHEMY_ENGINE_OPTIONS = DB_ENGINE_PROFILES[DB_PROFILE]
+    # sqlite 프로필에서 연결마다 실행하는 PRAGMA (busy_timeout: 쓰기 잠금 대기 ms, mmap_size: 바이트)
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS') or 5000),
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+    }
+
+    # 실시간 알림(SSE) 브로커: 'memory'(단일 프로세스) 또는 'sqlite'(여러 워커 프로세스 간 공유)
+    NOTIFICATION_BROKER = os.environ.get('NOTIFICATION_BROKER') or 'memory'
+    NOTIFICATION_BROKER_PATH = os.environ.get('NOTIFICATION_BROKER_PATH') or 'notification_events.db'
+    NOTIFICATION_STREAM_HEARTBEAT = 15  # 초, 연결 유지용 주석 이벤트 간격
+
+    # 알림 보존 정책: 읽은 알림은 N일 후 notifications_archive 로 이동 (`flask archive-notifications`)
+    NOTIFICATION_RETENTION_DAYS = int(os.environ.get('NOTIFICATION_RETENTION_DAYS') or 90)
+    NOTIFICATION_ARCHIVE_CHUNK_SIZE = 1000
+
+    # 요청 멱등 키 보관 시간 (재전송된 신청에 처음 결과를 돌려주는 기간)
+    IDEMPOTENCY_KEY_TTL_HOURS = 24
+
+    # 세션 principal 의 auth_version 확인 주기(초). 같은 프로세스의 변경은 커밋 즉시, 다른 워커의 변경은 최대 이 시간만큼 늦게 반영됨
+    AUTH_VERSION_TTL = 30
+
+    # 부재 캘린더 캐시 유효 시간(초). 같은 프로세스의 쓰기는 커밋 즉시 무효화되고, 다른 워커의 쓰기는 최대 이 시간만큼 늦게 반영됨
+    CALENDAR_CACHE_TTL = 60
+    # 캐시 항목(파트×월) 최대 개수. 넘으면 가장 오래 안 쓴 항목부터 버림
+    CALENDAR_CACHE_MAXSIZE = int(os.environ.get('CALENDAR_CACHE_MAXSIZE') or 512)
+
+    # 일괄 승인/반려 한 번에 받는 최대 건수 (넘으면 400)
+    BULK_APPROVAL_MAX_IDS = int(os.environ.get('BULK_APPROVAL_MAX_IDS') or 100)
+
+    # 파트별 동시 부재 인원 한도 (신청 시·최종 승인 시 검사). 예: PART_ABSENCE_LIMITS='{"Development": 3}'
+    # 목록에 없는 파트는 DEFAULT_PART_ABSENCE_LIMIT 적용, None 이면 제한 없음
+    PART_ABSENCE_LIMITS = json.loads(os.environ.get('PART_ABSENCE_LIMITS') or '{}')
+    DEFAULT_PART_ABSENCE_LIMIT = int(os.environ['DEFAULT_PART_ABSENCE_LIMIT']) if os.environ.get('DEFAULT_PART_ABSENCE_LIMIT') else None
+
+    # 연차 차감 일수 계산용 휴일: 공휴일 표(CSV, 상대 경로는 앱 폴더 기준) + 회사 지정 휴무일(YYYY-MM-DD, 콤마 구분)
+    # 바꾼 뒤에는 `flask recompute-balances` 로 원장을 다시 계산
+    HOLIDAY_FILE = os.environ.get('HOLIDAY_FILE') or 'data/holidays_kr.csv'
+    COMPANY_HOLIDAYS = [d for d in (os.environ.get('COMPANY_HOLIDAYS') or '').split(',') if d]
+
+    # 비밀번호 해시: werkzeug 방식 문자열(예: 'scrypt', 'pbkdf2:sha256:600000'), 해시 전용 프로세스 수, 대기+계산 제한 시간(초)
+    # 방식을 바꾸면 기존 사용자는 다음 로그인 때 새 방식으로 다시 해시됨. 워커 0 은 요청 스레드에서 직접 계산
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD') or 'scrypt'
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS') or 2)
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get('PASSWORD_HASH_TIMEOUT') or 5)
+
+    # 로그인 시도 제한(토큰 버킷): 아이디별·IP별 burst 회까지 연속 시도 가능, 이후 분당 rate 회씩 회복
+    # 'memory'(단일 프로세스) 또는 'sqlite'(여러 워커 프로세스 간 공유). 거절 수는 /admin/metrics 에서 확인
+    LOGIN_THROTTLE_BACKEND = os.environ.get('LOGIN_THROTTLE_BACKEND') or 'memory'
+    LOGIN_THROTTLE_PATH = os.environ.get('LOGIN_THROTTLE_PATH') or 'login_throttle.db'
+    LOGIN_THROTTLE_USERNAME_BURST = int(os.environ.get('LOGIN_THROTTLE_USERNAME_BURST') or 5)
+    LOGIN_THROTTLE_USERNAME_RATE = float(os.environ.get('LOGIN_THROTTLE_USERNAME_RATE') or 2)
+    # 사무실 NAT 뒤에서는 여러 직원이 IP 하나를 같이 쓰므로 넉넉하게
+    LOGIN_THROTTLE_IP_BURST = int(os.environ.get('LOGIN_THROTTLE_IP_BURST') or 60)
+    LOGIN_THROTTLE_IP_RATE = float(os.environ.get('LOGIN_THROTTLE_IP_RATE') or 30)
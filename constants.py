@@ -20,8 +20,36 @@ class UserRole:
     MEMBER = '팀원'
 
 
+class RoleFlag:
+    """users.role_flags 비트마스크 (UserRole 하나당 비트 하나)"""
+    TEAM_LEADER = 1 << 0
+    PART_LEADER = 1 << 1
+    MEMBER = 1 << 2
+
+    # (역할명, 비트) — 역할 문자열 변환 순서
+    BY_ROLE = (
+        (UserRole.TEAM_LEADER, TEAM_LEADER),
+        (UserRole.PART_LEADER, PART_LEADER),
+        (UserRole.MEMBER, MEMBER),
+    )
+
+    @classmethod
+    def from_role_string(cls, role):
+        """'파트장,팀장' 같은 콤마 문자열 → 비트마스크 ('개발팀장'처럼 역할명을 포함해도 인정)."""
+        flags = 0
+        for name, flag in cls.BY_ROLE:
+            if role and name in role:
+                flags |= flag
+        return flags
+
+    @classmethod
+    def to_role_names(cls, flags):
+        return [name for name, flag in cls.BY_ROLE if flags & flag]
+
+
 class AppConfig:
     TEMP_PASSWORD = "a123456!"
     MIN_WORK_MONTHS_FOR_ANNUAL_LEAVE = 3
     BASE_ANNUAL_LEAVE_DAYS = 15
     MAX_ANNUAL_LEAVE_FIRST_YEAR = 12
+    PAGE_SIZE = 50
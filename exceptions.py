@@ -22,3 +22,8 @@ class VacationValidationError(VacationSystemException):
 class UserNotFoundError(VacationSystemException):
     """사용자를 찾을 수 없는 예외"""
     pass
+
+
+class PasswordHashTimeout(VacationSystemException):
+    """비밀번호 해시/검증이 제한 시간 안에 끝나지 않은 예외 (해시 워커 포화)"""
+    pass
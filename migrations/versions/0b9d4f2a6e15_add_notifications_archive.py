@@ -0,0 +1,38 @@
+"""add notifications_archive
+
+Revision ID: 0b9d4f2a6e15
+Revises: f46c2b8e7a93
+Create Date: 2026-10-18 16:41:22.583017
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b9d4f2a6e15'
+down_revision = 'f46c2b8e7a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'notifications_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('is_read', sa.Boolean(), nullable=False),
+        sa.Column('timestamp', sa.DateTime(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('notifications_archive', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_notifications_archive_user_id'), ['user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('notifications_archive', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_notifications_archive_user_id'))
+
+    op.drop_table('notifications_archive')
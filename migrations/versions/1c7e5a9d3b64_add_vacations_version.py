@@ -0,0 +1,26 @@
+"""add vacations.version for optimistic concurrency
+
+Revision ID: 1c7e5a9d3b64
+Revises: 0b9d4f2a6e15
+Create Date: 2026-10-18 18:15:37.640281
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1c7e5a9d3b64'
+down_revision = '0b9d4f2a6e15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('vacations', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade():
+    with op.batch_alter_table('vacations', schema=None) as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,34 @@
+"""add leave_balances ledger
+
+Revision ID: 3f1a9c7d2b10
+Revises: 82c244f0e023
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1a9c7d2b10'
+down_revision = '82c244f0e023'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'leave_balances',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('leave_year', sa.Integer(), nullable=False),
+        sa.Column('used_days', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'leave_year', name='uq_leave_balances_user_year')
+    )
+    # 기존 데이터는 `flask recompute-balances` 로 채운다.
+
+
+def downgrade():
+    op.drop_table('leave_balances')
@@ -0,0 +1,41 @@
+"""replace users.role_flags B-tree index with partial indexes per role
+
+Revision ID: 4b8e1f6d2c73
+Revises: 9e4b7d2c1a58
+Create Date: 2026-10-18 22:14:37.208451
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b8e1f6d2c73'
+down_revision = '9e4b7d2c1a58'
+branch_labels = None
+depends_on = None
+
+# constants.RoleFlag 와 동일한 값 (마이그레이션은 앱 코드 변경과 무관하게 고정)
+TEAM_LEADER = 1
+PART_LEADER = 2
+
+
+def _role_flag_set(flag):
+    return sa.text(f"(role_flags & {flag}) != 0")
+
+
+def upgrade():
+    # role_flags & flag != 0 조건에는 role_flags 전체 B-tree 인덱스가 쓰이지 않음
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_role_flags')
+    op.create_index('ix_users_team_leaders', 'users', ['id'], unique=False,
+                    sqlite_where=_role_flag_set(TEAM_LEADER), postgresql_where=_role_flag_set(TEAM_LEADER))
+    op.create_index('ix_users_part_leaders', 'users', ['part'], unique=False,
+                    sqlite_where=_role_flag_set(PART_LEADER), postgresql_where=_role_flag_set(PART_LEADER))
+
+
+def downgrade():
+    op.drop_index('ix_users_part_leaders', table_name='users')
+    op.drop_index('ix_users_team_leaders', table_name='users')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_role_flags', ['role_flags'], unique=False)
@@ -0,0 +1,26 @@
+"""add users.auth_version for session principal invalidation
+
+Revision ID: 9e4b7d2c1a58
+Revises: 5d2a8c61f4e9
+Create Date: 2026-10-18 20:41:09.527613
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4b7d2c1a58'
+down_revision = '5d2a8c61f4e9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('auth_version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('auth_version')
@@ -0,0 +1,27 @@
+"""add composite index for vacation overlap check
+
+Revision ID: a7c4e19b5d32
+Revises: 3f1a9c7d2b10
+Create Date: 2026-10-18 10:03:11.452907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c4e19b5d32'
+down_revision = '3f1a9c7d2b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('vacations', schema=None) as batch_op:
+        batch_op.create_index('ix_vacations_applicant_status_dates',
+                              ['applicant_user_id', 'status', 'start_date', 'end_date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('vacations', schema=None) as batch_op:
+        batch_op.drop_index('ix_vacations_applicant_status_dates')
@@ -0,0 +1,45 @@
+"""add users.role_flags bitmask
+
+Revision ID: c52e8d0f6a41
+Revises: a7c4e19b5d32
+Create Date: 2026-10-18 11:26:54.730119
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c52e8d0f6a41'
+down_revision = 'a7c4e19b5d32'
+branch_labels = None
+depends_on = None
+
+# constants.RoleFlag 와 동일한 값 (마이그레이션은 앱 코드 변경과 무관하게 고정)
+TEAM_LEADER = 1
+PART_LEADER = 2
+MEMBER = 4
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('role_flags', sa.Integer(), nullable=False, server_default='0'))
+
+    # 기존 콤마 문자열 → 비트마스크 (역할명을 포함하면 해당 비트, '개발팀장' 등도 팀장으로 인정)
+    op.execute(
+        "UPDATE users SET role_flags = "
+        f"(CASE WHEN role LIKE '%팀장%' THEN {TEAM_LEADER} ELSE 0 END) + "
+        f"(CASE WHEN role LIKE '%파트장%' THEN {PART_LEADER} ELSE 0 END) + "
+        f"(CASE WHEN role LIKE '%팀원%' THEN {MEMBER} ELSE 0 END)"
+    )
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_role_flags'), ['role_flags'], unique=False)
+        batch_op.create_index('ix_users_part_role_flags', ['part', 'role_flags'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_part_role_flags')
+        batch_op.drop_index(batch_op.f('ix_users_role_flags'))
+        batch_op.drop_column('role_flags')
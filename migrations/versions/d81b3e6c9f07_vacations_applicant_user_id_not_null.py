@@ -0,0 +1,42 @@
+"""make vacations.applicant_user_id NOT NULL
+
+Revision ID: d81b3e6c9f07
+Revises: c52e8d0f6a41
+Create Date: 2026-10-18 13:02:37.905612
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd81b3e6c9f07'
+down_revision = 'c52e8d0f6a41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 대용량 테이블은 먼저 `flask backfill-applicant-ids` 로 chunk 단위로 채워 둘 것.
+    # 여기서는 남은 행만 한 번 더 채운다.
+    op.execute(
+        "UPDATE vacations SET applicant_user_id = "
+        "(SELECT users.id FROM users WHERE users.username = vacations.applicant) "
+        "WHERE applicant_user_id IS NULL"
+    )
+    orphans = op.get_bind().execute(
+        sa.text("SELECT COUNT(*) FROM vacations WHERE applicant_user_id IS NULL")
+    ).scalar()
+    if orphans:
+        raise RuntimeError(
+            f"신청자를 찾을 수 없는 휴가 {orphans}건이 있습니다. "
+            "`flask backfill-applicant-ids` 로 대상 id를 확인해 정리한 뒤 다시 실행하세요."
+        )
+
+    with op.batch_alter_table('vacations', schema=None) as batch_op:
+        batch_op.alter_column('applicant_user_id', existing_type=sa.Integer(), nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('vacations', schema=None) as batch_op:
+        batch_op.alter_column('applicant_user_id', existing_type=sa.Integer(), nullable=True)
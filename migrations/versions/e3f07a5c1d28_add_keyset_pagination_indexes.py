@@ -0,0 +1,34 @@
+"""add indexes for keyset pagination
+
+Revision ID: e3f07a5c1d28
+Revises: d81b3e6c9f07
+Create Date: 2026-10-18 14:20:05.311846
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3f07a5c1d28'
+down_revision = 'd81b3e6c9f07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('vacations', schema=None) as batch_op:
+        batch_op.create_index('ix_vacations_applicant_start_id',
+                              ['applicant_user_id', 'start_date', 'id'], unique=False)
+
+    with op.batch_alter_table('notifications', schema=None) as batch_op:
+        batch_op.create_index('ix_notifications_user_timestamp_id',
+                              ['user_id', 'timestamp', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('notifications', schema=None) as batch_op:
+        batch_op.drop_index('ix_notifications_user_timestamp_id')
+
+    with op.batch_alter_table('vacations', schema=None) as batch_op:
+        batch_op.drop_index('ix_vacations_applicant_start_id')
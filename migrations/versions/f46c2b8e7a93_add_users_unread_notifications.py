@@ -0,0 +1,32 @@
+"""add users.unread_notifications counter
+
+Revision ID: f46c2b8e7a93
+Revises: e3f07a5c1d28
+Create Date: 2026-10-18 15:08:49.204563
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f46c2b8e7a93'
+down_revision = 'e3f07a5c1d28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('unread_notifications', sa.Integer(), nullable=False, server_default='0'))
+
+    op.execute(
+        "UPDATE users SET unread_notifications = "
+        "(SELECT COUNT(*) FROM notifications "
+        " WHERE notifications.user_id = users.id AND NOT notifications.is_read)"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('unread_notifications')
@@ -1,46 +1,110 @@
 # models.py (B안 + employee_number)
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import literal_column, text
+from sqlalchemy.orm import validates
 from datetime import datetime, date
+from constants import RoleFlag
+from utils.db_routing import RoutingSession
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+def _role_flag_set(flag):
+    return text(f"(role_flags & {int(flag)}) != 0")
 
-db = SQLAlchemy()
 
 class User(db.Model):
     __tablename__ = 'users'
+    __table_args__ = (
+        # "파트 X의 파트장" 조회용
+        db.Index('ix_users_part_role_flags', 'part', 'role_flags'),
+        # 비트 AND 조건은 일반 B-tree 인덱스로 찾을 수 없으므로, 자주 찾는 역할만 부분 인덱스로
+        # (쿼리 조건이 인덱스 조건과 같은 모양이어야 쓰이므로 role_filter 는 flag 를 리터럴로 렌더링)
+        db.Index('ix_users_team_leaders', 'id',
+                 sqlite_where=_role_flag_set(RoleFlag.TEAM_LEADER),
+                 postgresql_where=_role_flag_set(RoleFlag.TEAM_LEADER)),
+        db.Index('ix_users_part_leaders', 'part',
+                 sqlite_where=_role_flag_set(RoleFlag.PART_LEADER),
+                 postgresql_where=_role_flag_set(RoleFlag.PART_LEADER)),
+    )
     id               = db.Column(db.Integer, primary_key=True)
     employee_number  = db.Column(db.String(32), unique=True, nullable=False, index=True)  # ← 사번
     username         = db.Column(db.String(50), unique=True, nullable=False, index=True)
     password         = db.Column(db.String(256), nullable=False)
     join_date        = db.Column(db.Date, nullable=False)        # YYYY-MM-DD → date
     part             = db.Column(db.String(50), nullable=False, index=True)
-    role             = db.Column(db.String(100), nullable=False) # '파트장','팀장' 등 콤마 가능
+    role             = db.Column(db.String(100), nullable=False) # '파트장','팀장' 등 콤마 가능 (표시용)
+    role_flags       = db.Column(db.Integer, default=0, nullable=False)  # RoleFlag 비트마스크 (권한 판단용)
     is_temp_password = db.Column(db.Boolean, default=False, nullable=False)
+    unread_notifications = db.Column(db.Integer, default=0, nullable=False)  # 미읽음 알림 수 (NotificationService가 갱신)
+    auth_version     = db.Column(db.Integer, default=1, nullable=False)  # 세션 principal 무효화용 (권한·계정 변경 시 +1)
 
+    # 자식 컬렉션은 기본 로딩하지 않음(접근 시 예외). 필요한 곳에서만 selectinload 등 명시.
     vacations = db.relationship(
         'Vacation',
         back_populates='applicant_user',
         cascade='all, delete-orphan',
-        lazy='selectin',
+        lazy='raise',
         foreign_keys='Vacation.applicant_user_id',
     )
     notifications = db.relationship(
         'Notification',
         back_populates='user',
         cascade='all, delete-orphan',
-        lazy='selectin',
+        lazy='raise',
+    )
+    leave_balances = db.relationship(
+        'LeaveBalance',
+        back_populates='user',
+        cascade='all, delete-orphan',
+        lazy='raise',
     )
 
+    @validates('role')
+    def _sync_role_flags(self, key, role):
+        # role 문자열이 바뀔 때마다 비트마스크도 함께 갱신
+        self.role_flags = RoleFlag.from_role_string(role)
+        return role
+
+    def has_role(self, flag):
+        return bool((self.role_flags or 0) & flag)
+
+    @property
+    def is_team_leader(self):
+        return self.has_role(RoleFlag.TEAM_LEADER)
+
+    @property
+    def is_part_leader(self):
+        return self.has_role(RoleFlag.PART_LEADER)
+
+    @property
+    def role_names(self):
+        return RoleFlag.to_role_names(self.role_flags or 0)
+
+    @classmethod
+    def role_filter(cls, flag):
+        """role_flags & flag != 0 조건식 (쿼리 filter 용)"""
+        return cls.role_flags.op('&')(literal_column(str(int(flag)))) != literal_column('0')
+
     def __repr__(self):
         return f'<User {self.employee_number} / {self.username}>'
 
 class Vacation(db.Model):
     __tablename__ = 'vacations'
+    __table_args__ = (
+        # 기간 중복 검사(EXISTS)용 복합 인덱스
+        db.Index('ix_vacations_applicant_status_dates',
+                 'applicant_user_id', 'status', 'start_date', 'end_date'),
+        # 내 신청 내역 keyset 페이지 (start_date, id)
+        db.Index('ix_vacations_applicant_start_id', 'applicant_user_id', 'start_date', 'id'),
+    )
     id                 = db.Column(db.Integer, primary_key=True)
 
     # 호환용(기존 서비스/데이터 유지)
     applicant          = db.Column(db.String(50), nullable=False, index=True)
 
     # 정석: FK
-    applicant_user_id  = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
+    applicant_user_id  = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     applicant_user     = db.relationship('User', back_populates='vacations', foreign_keys=[applicant_user_id])
 
     vacation_type      = db.Column(db.String(20), nullable=False)         # 'annual','am_half_day','pm_half_day'
@@ -49,12 +113,17 @@ class Vacation(db.Model):
     reason             = db.Column(db.Text, nullable=False)
     backup             = db.Column(db.String(50), nullable=False)
     status             = db.Column(db.String(32), nullable=False, index=True)  # 'pending_part_leader', ...
+    version            = db.Column(db.Integer, default=1, nullable=False)  # 낙관적 동시성 제어 (상태 전이마다 +1)
 
     def __repr__(self):
         return f'<Vacation {self.applicant} - {self.start_date}>'
 
 class Notification(db.Model):
     __tablename__ = 'notifications'
+    __table_args__ = (
+        # 알림 목록 keyset 페이지 (timestamp, id)
+        db.Index('ix_notifications_user_timestamp_id', 'user_id', 'timestamp', 'id'),
+    )
     id        = db.Column(db.Integer, primary_key=True)
     user_id   = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     message   = db.Column(db.Text, nullable=False)
@@ -65,3 +134,47 @@ class Notification(db.Model):
 
     def __repr__(self):
         return f'<Notification {self.user_id} - {self.message[:20]}>'
+
+class LeaveBalance(db.Model):
+    """사용자별·연차연도별 연차 사용량 원장 (신청/승인/반려/취소 트랜잭션 안에서 갱신)."""
+    __tablename__ = 'leave_balances'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'leave_year', name='uq_leave_balances_user_year'),
+    )
+    id         = db.Column(db.Integer, primary_key=True)
+    user_id    = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    leave_year = db.Column(db.Integer, nullable=False)                  # 연차 연도(시작일 기준 달력 연도)
+    used_days  = db.Column(db.Float, default=0.0, nullable=False)       # 승인 + 결재 대기 연차 합계
+
+    user = db.relationship('User', back_populates='leave_balances')
+
+    def __repr__(self):
+        return f'<LeaveBalance {self.user_id} - {self.leave_year}: {self.used_days}>'
+
+class NotificationArchive(db.Model):
+    """보존 기간이 지난 읽은 알림 보관 테이블 (notifications 테이블 크기 유지용, id는 원본 그대로)."""
+    __tablename__ = 'notifications_archive'
+    id          = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    user_id     = db.Column(db.Integer, nullable=False, index=True)   # 사용자 삭제와 무관하게 보관 → FK 없음
+    message     = db.Column(db.Text, nullable=False)
+    is_read     = db.Column(db.Boolean, nullable=False)
+    timestamp   = db.Column(db.DateTime, nullable=False)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<NotificationArchive {self.user_id} - {self.message[:20]}>'
+
+class IdempotencyKey(db.Model):
+    """요청 멱등 키: 같은 키로 다시 들어온 POST 에는 처음 결과(JSON)를 그대로 돌려줌."""
+    __tablename__ = 'idempotency_keys'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'key', name='uq_idempotency_keys_user_key'),
+    )
+    id         = db.Column(db.Integer, primary_key=True)
+    user_id    = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    key        = db.Column(db.String(64), nullable=False)
+    result     = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<IdempotencyKey {self.user_id} - {self.key}>'
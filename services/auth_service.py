@@ -1,16 +1,22 @@
 # services/auth_service.py
-from werkzeug.security import check_password_hash, generate_password_hash
 from models import User, db
+from utils.password_hasher import get_password_hasher
 import re
 
 
 class AuthService:
     def authenticate_user(self, username, password):
         user = User.query.filter_by(username=username).first()
+        hasher = get_password_hasher()
         
-        if user and check_password_hash(user.password, password):
+        if user and hasher.verify(user.password, password):
+            # 예전 해시 설정으로 저장된 비밀번호는 로그인에 성공한 김에 현재 설정으로 다시 해시
+            if hasher.needs_rehash(user.password):
+                user.password = hasher.hash(password)
+                db.session.commit()
             return {
                 'success': True,
+                'user': user,
                 'is_temp_password': user.is_temp_password
             }
         else:
@@ -19,7 +25,7 @@ class AuthService:
                 'message': "로그인 실패. 아이디 또는 비밀번호가 올바르지 않습니다."
             }
     
-    def change_password(self, username, new_password, confirm_password):
+    def change_password(self, user, new_password, confirm_password):
         temp_password = "a123456!"
         
         if new_password == temp_password:
@@ -51,8 +57,7 @@ class AuthService:
                 'type': 'error'
             }
         
-        user = User.query.filter_by(username=username).first()
-        user.password = generate_password_hash(new_password)
+        user.password = get_password_hasher().hash(new_password)
         user.is_temp_password = False
         db.session.commit()
         
@@ -0,0 +1,102 @@
+# services/calendar_service.py
+import threading
+import time
+from calendar import monthrange
+from collections import OrderedDict
+from datetime import date, timedelta
+from flask import current_app
+from models import User, Vacation, db
+from utils.intervals import day_buckets
+from utils.transaction_hooks import on_commit
+
+
+# 캘린더에 표시하는 상태 (결재 대기 + 승인)
+CALENDAR_STATES = ('pending_part_leader', 'pending_team_leader', 'approved')
+
+# (part, 'YYYY-MM') → (저장 시각, 결과). 프로세스 단위 LRU 캐시(최대 CALENDAR_CACHE_MAXSIZE 개),
+# 쓰기 커밋 시 해당 월을 무효화
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _months(start, end):
+    """start ~ end 가 걸친 'YYYY-MM' 목록."""
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+class CalendarService:
+    """파트별 월간 부재 캘린더 (하루 단위 버킷)."""
+
+    def get_month(self, part, year, month):
+        key = (part, f"{year:04d}-{month:02d}")
+        ttl = current_app.config['CALENDAR_CACHE_TTL']
+        with _cache_lock:
+            cached = _cache.get(key)
+            if cached:
+                _cache.move_to_end(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        result = self._build_month(part, year, month)
+        maxsize = current_app.config['CALENDAR_CACHE_MAXSIZE']
+        with _cache_lock:
+            _cache[key] = (time.monotonic(), result)
+            _cache.move_to_end(key)
+            while len(_cache) > maxsize:
+                _cache.popitem(last=False)  # 가장 오래 안 쓴 항목
+        return result
+
+    def _build_month(self, part, year, month):
+        month_start = date(year, month, 1)
+        month_end = date(year, month, monthrange(year, month)[1])
+
+        # 월과 겹치는 휴가를 한 번의 범위 쿼리로 (start_date/end_date 인덱스)
+        rows = (db.session.query(Vacation.id, Vacation.vacation_type, Vacation.status,
+                                 Vacation.start_date, Vacation.end_date, User.username)
+                .join(User, User.id == Vacation.applicant_user_id)
+                .filter(User.part == part,
+                        Vacation.status.in_(CALENDAR_STATES),
+                        Vacation.start_date <= month_end,
+                        Vacation.end_date >= month_start)
+                .order_by(User.username, Vacation.start_date)
+                .all())
+
+        buckets = day_buckets(
+            ((r.start_date, r.end_date, {'vacation_id': r.id, 'username': r.username,
+                                         'vacation_type': r.vacation_type, 'status': r.status})
+             for r in rows),
+            month_start, month_end
+        )
+        return {
+            'part': part,
+            'month': f"{year:04d}-{month:02d}",
+            'days': [
+                {'date': (month_start + timedelta(days=i)).isoformat(),
+                 'count': len(absences),
+                 'absences': absences}
+                for i, absences in enumerate(buckets)
+            ]
+        }
+
+    def get_parts(self):
+        return [p for (p,) in db.session.query(User.part).distinct().order_by(User.part)]
+
+    # -------- 캐시 무효화 (커밋 후 실행) --------
+    def invalidate_after_commit(self, start_date=None, end_date=None):
+        """start_date ~ end_date 가 걸친 월의 캐시를 커밋 후 지웁니다 (모든 파트). 날짜가 없으면 전부."""
+        months = set(_months(start_date, end_date)) if start_date else None
+        on_commit(lambda: self._invalidate(months))
+
+    @staticmethod
+    def _invalidate(months):
+        with _cache_lock:
+            if months is None:
+                _cache.clear()
+                return
+            for key in [k for k in _cache if k[1] in months]:
+                del _cache[key]
@@ -0,0 +1,26 @@
+# services/idempotency_service.py
+import json
+from datetime import datetime, timedelta
+from flask import current_app
+from models import IdempotencyKey, db
+
+
+class IdempotencyService:
+    """재전송된 POST(더블 클릭, 네트워크 재시도)에 처음 결과를 돌려주기 위한 요청 키 저장소.
+
+    키는 사용자별로 고유하며, 호출자의 트랜잭션 안에서 작업 결과와 함께 커밋됩니다.
+    """
+
+    def get_result(self, user_id, key):
+        stored = (db.session.query(IdempotencyKey.result)
+                  .filter_by(user_id=user_id, key=key)
+                  .scalar())
+        return json.loads(stored) if stored is not None else None
+
+    def save_result(self, user_id, key, result):
+        """결과를 기록합니다 (커밋하지 않음). 보관 기간이 지난 이 사용자의 키도 함께 정리합니다."""
+        cutoff = datetime.utcnow() - timedelta(hours=current_app.config['IDEMPOTENCY_KEY_TTL_HOURS'])
+        (IdempotencyKey.query
+         .filter(IdempotencyKey.user_id == user_id, IdempotencyKey.created_at < cutoff)
+         .delete(synchronize_session=False))
+        db.session.add(IdempotencyKey(user_id=user_id, key=key, result=json.dumps(result, ensure_ascii=False)))
@@ -0,0 +1,132 @@
+# services/leave_balance_service.py
+from collections import defaultdict
+from datetime import date
+from sqlalchemy import update
+from models import LeaveBalance, User, Vacation, db
+from utils.vacation_calculator import VacationCalculator
+
+
+# 연차를 차감하는 상태(결재 대기 + 승인)와 종류
+COUNTED_STATES = ('pending_part_leader', 'pending_team_leader', 'approved')
+COUNTED_TYPES = ('annual', 'am_half_day', 'pm_half_day')
+
+
+class LeaveBalanceService:
+    """연차 사용량 원장(leave_balances) 관리.
+
+    apply/reject/cancel 은 호출자의 트랜잭션 안에서 원장을 증감시키고,
+    커밋은 호출자가 한 번만 수행합니다.
+    """
+
+    def __init__(self):
+        self.calculator = VacationCalculator()
+
+    # -------- Reads --------
+    def get_used_days(self, user_id, leave_year):
+        used = (db.session.query(LeaveBalance.used_days)
+                .filter_by(user_id=user_id, leave_year=leave_year)
+                .scalar())
+        return used or 0.0
+
+    def get_overview(self, users, as_of=None):
+        """사용자 목록의 부여 연차(일괄 계산)와 기준 연도 사용량을 {user_id: {...}} 로 반환합니다."""
+        as_of = as_of or date.today()
+        user_ids = [u.id for u in users]
+        entitled = self.calculator.calculate_annual_leave_batch([u.join_date for u in users], as_of)
+        used = dict(db.session.query(LeaveBalance.user_id, LeaveBalance.used_days)
+                    .filter(LeaveBalance.user_id.in_(user_ids), LeaveBalance.leave_year == as_of.year)
+                    .all())
+        return {
+            uid: {'entitled': int(days), 'used': used.get(uid, 0.0), 'remaining': int(days) - used.get(uid, 0.0)}
+            for uid, days in zip(user_ids, entitled)
+        }
+
+    # -------- Mutations (커밋하지 않음) --------
+    def add_vacation(self, user_id, vacation):
+        self._apply(user_id, vacation, 1)
+
+    def remove_vacation(self, user_id, vacation):
+        self._apply(user_id, vacation, -1)
+
+    def _apply(self, user_id, vacation, sign):
+        days_by_year = self.calculator.leave_days_by_year(
+            vacation.vacation_type, vacation.start_date, vacation.end_date
+        )
+        for leave_year, days in days_by_year.items():
+            if days:
+                self._adjust(user_id, leave_year, sign * days)
+
+    def _adjust(self, user_id, leave_year, delta):
+        result = db.session.execute(
+            update(LeaveBalance)
+            .where(LeaveBalance.user_id == user_id, LeaveBalance.leave_year == leave_year)
+            .values(used_days=LeaveBalance.used_days + delta)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.session.add(LeaveBalance(user_id=user_id, leave_year=leave_year, used_days=delta))
+            db.session.flush()
+
+    # -------- Rebuild --------
+    def recompute(self, chunk_size=500, dry_run=False):
+        """원본 휴가 행으로부터 원장을 사용자 chunk 단위로 다시 계산합니다.
+
+        반환값: 어긋난 항목 리스트 [{'user_id', 'leave_year', 'stored', 'expected'}, ...]
+        """
+        drift = []
+        last_id = 0
+        while True:
+            users = (db.session.query(User.id)
+                     .filter(User.id > last_id)
+                     .order_by(User.id)
+                     .limit(chunk_size)
+                     .all())
+            if not users:
+                break
+            last_id = users[-1].id
+
+            drift.extend(self._recompute_chunk(users, dry_run))
+            if dry_run:
+                db.session.rollback()
+            else:
+                db.session.commit()
+        return drift
+
+    def _recompute_chunk(self, users, dry_run):
+        user_ids = [u.id for u in users]
+
+        rows = (db.session.query(Vacation.applicant_user_id, Vacation.vacation_type,
+                                 Vacation.start_date, Vacation.end_date)
+                .filter(Vacation.applicant_user_id.in_(user_ids),
+                        Vacation.status.in_(COUNTED_STATES),
+                        Vacation.vacation_type.in_(COUNTED_TYPES))
+                .all())
+
+        expected = defaultdict(float)
+        for r in rows:
+            for leave_year, days in self.calculator.leave_days_by_year(
+                    r.vacation_type, r.start_date, r.end_date).items():
+                expected[(r.applicant_user_id, leave_year)] += days
+
+        stored = {(b.user_id, b.leave_year): b
+                  for b in LeaveBalance.query.filter(LeaveBalance.user_id.in_(user_ids)).all()}
+
+        drift = []
+        for key in set(expected) | set(stored):
+            balance = stored.get(key)
+            stored_days = balance.used_days if balance else 0.0
+            expected_days = expected.get(key, 0.0)
+            if stored_days == expected_days:
+                continue
+
+            drift.append({'user_id': key[0], 'leave_year': key[1],
+                          'stored': stored_days, 'expected': expected_days})
+            if dry_run:
+                continue
+            if balance is None:
+                db.session.add(LeaveBalance(user_id=key[0], leave_year=key[1], used_days=expected_days))
+            elif expected_days:
+                balance.used_days = expected_days
+            else:
+                db.session.delete(balance)
+        return drift
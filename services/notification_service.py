@@ -1,9 +1,20 @@
 # services/notification_service.py
-from models import Notification, db
-from datetime import datetime
+from collections import Counter, defaultdict
+from sqlalchemy import delete, func, insert, literal, select, tuple_, update
+from models import Notification, NotificationArchive, User, db
+from datetime import datetime, timedelta
+from constants import AppConfig
+from utils.pagination import decode_cursor, encode_cursor, keyset_page
+from utils.notification_broker import publish_after_commit
+from utils.db_routing import read_only
 
 
 class NotificationService:
+    """알림 생성은 호출자의 트랜잭션에 합류합니다(커밋하지 않음).
+
+    상태 변경과 알림이 한 번의 커밋으로 함께 반영되도록 커밋은 호출자가 수행합니다.
+    """
+
     def create_notification(self, user_id, message):
         notification = Notification(
             user_id=user_id,
@@ -11,25 +22,155 @@ class NotificationService:
             timestamp=datetime.utcnow()
         )
         db.session.add(notification)
-        db.session.commit()
+        self._adjust_unread_count(user_id, 1)
+        publish_after_commit([user_id], {'delta': 1, 'message': message})
         return notification
+
+    def create_notifications(self, user_ids, message):
+        """여러 사용자에게 같은 알림을 INSERT 한 번(executemany)으로 추가합니다."""
+        user_ids = list(dict.fromkeys(user_ids))  # 중복 제거(순서 유지)
+        self.create_notification_rows([(user_id, message) for user_id in user_ids])
+
+    def create_notification_rows(self, rows):
+        """(user_id, message) 목록을 INSERT 한 번(executemany)으로 추가합니다."""
+        if not rows:
+            return
+        now = datetime.utcnow()
+        db.session.execute(insert(Notification), [
+            {'user_id': user_id, 'message': message, 'is_read': False, 'timestamp': now}
+            for user_id, message in rows
+        ])
+
+        # 미읽음 카운터: 받은 알림 수가 같은 사용자끼리 UPDATE 한 번
+        counts = Counter(user_id for user_id, _ in rows)
+        by_delta = defaultdict(list)
+        for user_id, delta in counts.items():
+            by_delta[delta].append(user_id)
+        for delta, user_ids in by_delta.items():
+            db.session.execute(
+                update(User)
+                .where(User.id.in_(user_ids))
+                .values(unread_notifications=User.unread_notifications + delta)
+                .execution_options(synchronize_session=False)
+            )
+            publish_after_commit(user_ids, {'delta': delta})
+
+    @read_only
+    def get_user_notifications(self, user_id, cursor=None, limit=AppConfig.PAGE_SIZE):
+        """(timestamp, id) 내림차순 keyset 페이지."""
+        query = Notification.query.filter_by(user_id=user_id)
+        after = decode_cursor(cursor, datetime, int)
+        if after:
+            query = query.filter(tuple_(Notification.timestamp, Notification.id) < after)
+        query = query.order_by(Notification.timestamp.desc(), Notification.id.desc())
+        return keyset_page(query, limit, lambda n: encode_cursor(n.timestamp, n.id))
     
-    def get_user_notifications(self, user_id):
-        return Notification.query.filter_by(user_id=user_id).order_by(
-            Notification.timestamp.desc()
-        ).all()
-    
+    @read_only
     def get_unread_count(self, user_id):
-        return Notification.query.filter_by(user_id=user_id, is_read=False).count()
+        """users.unread_notifications 컬럼 값 (COUNT 쿼리 없음)."""
+        return db.session.query(User.unread_notifications).filter_by(id=user_id).scalar() or 0
     
     def mark_all_as_read(self, user_id):
-        notifications = Notification.query.filter_by(user_id=user_id, is_read=False).all()
-        for notification in notifications:
-            notification.is_read = True
+        result = db.session.execute(
+            update(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read.is_(False))
+            .values(is_read=True)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            # 동시에 추가된 알림을 지우지 않도록 0으로 덮어쓰지 않고 실제 읽음 처리한 수만큼 차감
+            self._adjust_unread_count(user_id, -result.rowcount)
+            publish_after_commit([user_id], {'delta': -result.rowcount})
         db.session.commit()
     
     def mark_as_read(self, notification_id):
-        notification = Notification.query.get(notification_id)
-        if notification:
-            notification.is_read = True
+        user_id = db.session.query(Notification.user_id).filter_by(id=notification_id).scalar()
+        if user_id is None:
+            return
+        result = db.session.execute(
+            update(Notification)
+            .where(Notification.id == notification_id, Notification.is_read.is_(False))
+            .values(is_read=True)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            self._adjust_unread_count(user_id, -1)
+            publish_after_commit([user_id], {'delta': -1})
             db.session.commit()
+
+    def reconcile_unread_counts(self, chunk_size=500):
+        """users.unread_notifications 를 실제 미읽음 수와 비교해 어긋난 값을 고칩니다.
+
+        반환값: [{'user_id', 'stored', 'actual'}, ...]
+        """
+        drift = []
+        last_id = 0
+        while True:
+            users = (db.session.query(User.id, User.unread_notifications)
+                     .filter(User.id > last_id)
+                     .order_by(User.id)
+                     .limit(chunk_size)
+                     .all())
+            if not users:
+                break
+            last_id = users[-1].id
+
+            actual = dict(db.session.query(Notification.user_id, func.count(Notification.id))
+                          .filter(Notification.user_id.in_([u.id for u in users]),
+                                  Notification.is_read.is_(False))
+                          .group_by(Notification.user_id)
+                          .all())
+            for u in users:
+                count = actual.get(u.id, 0)
+                if u.unread_notifications != count:
+                    drift.append({'user_id': u.id, 'stored': u.unread_notifications, 'actual': count})
+                    db.session.execute(
+                        update(User)
+                        .where(User.id == u.id)
+                        .values(unread_notifications=count)
+                        .execution_options(synchronize_session=False)
+                    )
+            db.session.commit()
+        return drift
+
+    def archive_read_notifications(self, retention_days, chunk_size=1000):
+        """retention_days 보다 오래된 읽은 알림을 notifications_archive 로 옮깁니다.
+
+        chunk 단위로 복사 후 삭제하고 커밋하므로 큰 테이블에서도 잠금 시간이 짧고,
+        중간에 끊겨도 다시 실행하면 남은 행부터 이어서 처리합니다. 반환값: 이동한 행 수
+        """
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        moved = 0
+        while True:
+            ids = [nid for (nid,) in (db.session.query(Notification.id)
+                                      .filter(Notification.is_read.is_(True),
+                                              Notification.timestamp < cutoff)
+                                      .order_by(Notification.id)
+                                      .limit(chunk_size))]
+            if not ids:
+                break
+
+            db.session.execute(
+                insert(NotificationArchive).from_select(
+                    ['id', 'user_id', 'message', 'is_read', 'timestamp', 'archived_at'],
+                    select(Notification.id, Notification.user_id, Notification.message,
+                           Notification.is_read, Notification.timestamp, literal(datetime.utcnow()))
+                    .where(Notification.id.in_(ids))
+                )
+            )
+            db.session.execute(
+                delete(Notification)
+                .where(Notification.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+            moved += len(ids)
+        return moved
+
+    def _adjust_unread_count(self, user_id, delta):
+        db.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(unread_notifications=User.unread_notifications + delta)
+            .execution_options(synchronize_session=False)
+        )
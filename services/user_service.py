@@ -1,10 +1,35 @@
 # services/user_service.py
+import csv
 from datetime import date as _date
-from werkzeug.security import generate_password_hash
-from models import User, db
+from itertools import islice, repeat
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from models import IdempotencyKey, NotificationArchive, User, db
+from constants import AppConfig, RoleFlag
+from services.calendar_service import CalendarService
+from utils.pagination import decode_cursor, encode_cursor, keyset_page
+from utils.password_hasher import get_password_hasher
+from utils.principal import bump_auth_version, forget_after_commit
+from utils.db_routing import read_only
+
+
+# 일괄 등록 CSV 필수 열
+IMPORT_COLUMNS = ('employee_number', 'username', 'join_date', 'part', 'role')
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
 
 
 class UserService:
+    def __init__(self):
+        self.calendar_service = CalendarService()
+
     # -------- Helpers --------
     def _parse_date(self, value):
         """YYYY-MM-DD 문자열 또는 date 객체를 받아 date로 반환."""
@@ -22,8 +47,14 @@ class UserService:
     def get_user_by_employee_number(self, employee_number):
         return User.query.filter_by(employee_number=employee_number).first()
 
-    def get_all_users(self):
-        return User.query.order_by(User.id.desc()).all()
+    @read_only
+    def get_all_users(self, cursor=None, limit=AppConfig.PAGE_SIZE):
+        """id 내림차순 keyset 페이지."""
+        query = User.query
+        after = decode_cursor(cursor, int)
+        if after:
+            query = query.filter(User.id < after[0])
+        return keyset_page(query.order_by(User.id.desc()), limit, lambda u: encode_cursor(u.id))
 
     # -------- Mutations --------
     def create_user(self, user_data):
@@ -50,7 +81,7 @@ class UserService:
 
         # 비밀번호 생성(임시)
         temp_password = "a123456!"
-        hashed_password = generate_password_hash(temp_password)
+        hashed_password = get_password_hasher().hash(temp_password)
 
         # join_date 파싱
         try:
@@ -103,27 +134,124 @@ class UserService:
         except Exception:
             return {'success': False, 'message': "입사일 형식이 올바르지 않습니다. YYYY-MM-DD로 입력해 주세요.", 'type': 'error'}
 
+        principal_before = (user.username, user.part, user.role_flags)
         user.employee_number = emp_no
         user.username = username
         user.join_date = jd
         user.part = user_data.get('part', '')
         user.role = user_data.get('role', '')
+        # 세션 principal 에 담긴 값(아이디·파트·권한)이 바뀌면 기존 로그인 세션 무효화
+        if (user.username, user.part, user.role_flags) != principal_before:
+            bump_auth_version(user)
 
+        # 파트·아이디가 바뀌면 캘린더 표시도 달라짐
+        self.calendar_service.invalidate_after_commit()
         db.session.commit()
 
         return {'success': True, 'message': "사용자 정보가 성공적으로 수정되었습니다.", 'type': 'success'}
 
     def delete_user(self, user_id):
         user = self.get_user_by_id(user_id)
+        NotificationArchive.query.filter_by(user_id=user.id).delete(synchronize_session=False)
+        IdempotencyKey.query.filter_by(user_id=user.id).delete(synchronize_session=False)
         db.session.delete(user)
+        forget_after_commit(user.id)
+        self.calendar_service.invalidate_after_commit()
         db.session.commit()
         return {'success': True, 'message': "사용자가 성공적으로 삭제(퇴사)되었습니다.", 'type': 'success'}
 
+    # -------- Bulk import --------
+    def import_users(self, lines, chunk_size=500, hash_workers=None):
+        """CSV(employee_number, username, join_date, part, role)를 chunk 단위로 읽어 사용자를 일괄 등록합니다.
+
+        - 중복 검사: 기존 사번·아이디를 set 으로 한 번 읽어 두고, 파일 안의 중복도 같은 set 으로 걸러냄
+        - 임시 비밀번호 해시: 로그인용과 별도인 임시 프로세스 풀에서 병렬 계산 (hash_workers=None 이면 설정값)
+        - 저장: chunk 마다 executemany INSERT 후 커밋 (뒤 chunk 가 실패해도 앞 chunk 는 유지)
+
+        lines 는 텍스트 줄 iterable(열린 파일 등)이며 전체를 메모리에 올리지 않습니다.
+        반환값: {'created': 등록 수, 'errors': [{'line', 'employee_number', 'username', 'message'}, ...]}
+        """
+        reader = csv.DictReader(lines)
+        missing = [c for c in IMPORT_COLUMNS if c not in (reader.fieldnames or [])]
+        if missing:
+            return {'created': 0, 'errors': [{'line': 1, 'employee_number': '', 'username': '',
+                                              'message': f"필수 열이 없습니다: {', '.join(missing)}"}]}
+
+        employee_numbers = {e for (e,) in db.session.query(User.employee_number)}
+        usernames = {u for (u,) in db.session.query(User.username)}
+
+        created = 0
+        errors = []
+        with get_password_hasher().batch(hash_workers) as hash_many:
+            for chunk in _chunks(enumerate(reader, start=2), chunk_size):
+                rows = []
+                row_lines = []
+                for line, record in chunk:
+                    row, message = self._parse_import_row(record, employee_numbers, usernames)
+                    if message:
+                        errors.append({'line': line, 'employee_number': (record.get('employee_number') or '').strip(),
+                                       'username': (record.get('username') or '').strip(), 'message': message})
+                        continue
+                    employee_numbers.add(row['employee_number'])
+                    usernames.add(row['username'])
+                    rows.append(row)
+                    row_lines.append(line)
+                if not rows:
+                    continue
+
+                for row, hashed in zip(rows, hash_many(repeat(AppConfig.TEMP_PASSWORD, len(rows)))):
+                    row['password'] = hashed
+
+                try:
+                    db.session.execute(insert(User), rows)
+                    db.session.commit()
+                except IntegrityError:
+                    # 가져오는 도중 다른 경로로 같은 사번/아이디가 등록된 경우: 이 chunk 만 실패 처리
+                    db.session.rollback()
+                    errors.extend({'line': line, 'employee_number': row['employee_number'],
+                                   'username': row['username'],
+                                   'message': "다른 사용자와 사번 또는 아이디가 중복되어 이 묶음이 저장되지 않았습니다."}
+                                  for line, row in zip(row_lines, rows))
+                    continue
+                created += len(rows)
+
+        errors.sort(key=lambda e: e['line'])
+        return {'created': created, 'errors': errors}
+
+    def _parse_import_row(self, record, employee_numbers, usernames):
+        """CSV 한 행 → (INSERT 용 dict, None) 또는 (None, 오류 메시지)."""
+        emp_no = (record.get('employee_number') or '').strip()
+        username = (record.get('username') or '').strip()
+        if not emp_no:
+            return None, "사번은 필수입니다."
+        if not username:
+            return None, "사용자 아이디는 필수입니다."
+        if emp_no in employee_numbers:
+            return None, "이미 존재하는 사번입니다."
+        if username in usernames:
+            return None, "이미 존재하는 사용자 아이디입니다."
+        try:
+            join_date = self._parse_date((record.get('join_date') or '').strip())
+        except ValueError:
+            return None, "입사일 형식이 올바르지 않습니다. YYYY-MM-DD로 입력해 주세요."
+
+        role = (record.get('role') or '').strip()
+        return {
+            'employee_number': emp_no,
+            'username': username,
+            'join_date': join_date,
+            'part': (record.get('part') or '').strip(),
+            'role': role,
+            'role_flags': RoleFlag.from_role_string(role),  # executemany INSERT 는 @validates 를 거치지 않음
+            'is_temp_password': True,
+        }, None
+
     def reset_password(self, user_id):
         user = self.get_user_by_id(user_id)
         temp_password = "a123456!"
-        user.password = generate_password_hash(temp_password)
+        user.password = get_password_hasher().hash(temp_password)
         user.is_temp_password = True
+        bump_auth_version(user)
         db.session.commit()
         return {
             'success': True,
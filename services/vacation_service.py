@@ -1,30 +1,86 @@
 # services/vacation_service.py
-from datetime import date
-from sqlalchemy import or_, and_
+from datetime import date, timedelta
+from flask import current_app
+from sqlalchemy import or_, and_, delete, select, tuple_, update
+from sqlalchemy.orm.attributes import set_committed_value
+from constants import AppConfig, RoleFlag
 from models import User, Vacation, db
+from services.calendar_service import CalendarService
+from services.idempotency_service import IdempotencyService
 from services.notification_service import NotificationService
+from services.leave_balance_service import LeaveBalanceService
+from utils.db_locks import lock_part, lock_user
+from utils.holiday_calendar import get_holiday_calendar
+from utils.intervals import day_counts
 from utils.vacation_calculator import VacationCalculator
+from utils.pagination import Page, decode_cursor, encode_cursor, keyset_page
+from utils.db_routing import read_only
 
 
 PENDING_STATES = ('pending_part_leader', 'pending_team_leader')
 FINAL_STATES = ('approved', 'rejected')
+ACTIVE_STATES = PENDING_STATES + ('approved',)
+
+# 급여 정산용 CSV 내보내기 열
+EXPORT_COLUMNS = ('vacation_id', 'employee_number', 'username', 'part', 'vacation_type',
+                  'start_date', 'end_date', 'leave_days', 'status')
+
+# 다른 결재자가 먼저 상태를 바꾼 경우의 결과
+CONFLICT_RESULT = {
+    'success': False,
+    'message': "다른 결재자가 먼저 처리한 건입니다. 목록을 새로고침해 주세요.",
+    'type': 'error',
+    'conflict': True
+}
+
+# 알림 outbox 에서 "전체 팀장"을 나타내는 수신자 표식
+TEAM_LEADERS = object()
 
 
 class VacationService:
     def __init__(self):
         self.notification_service = NotificationService()
+        self.leave_balance_service = LeaveBalanceService()
+        self.idempotency_service = IdempotencyService()
+        self.calendar_service = CalendarService()
         self.calculator = VacationCalculator()
 
     # ----------------------------
     # Create / Cancel
     # ----------------------------
-    def apply_vacation(self, username, vacation_data):
-        user_info = User.query.filter_by(username=username).first()
+    def apply_vacation(self, user_info, vacation_data, idempotency_key=None):
+        """휴가 신청. 같은 사용자의 신청은 사용자 잠금으로 직렬화되어 검사와 저장 사이에 다른 신청이 끼어들 수 없습니다.
 
+        idempotency_key 가 같은 재전송은 다시 처리하지 않고 처음 성공 결과를 그대로 돌려줍니다.
+        """
         # 입력은 문자열(YYYY-MM-DD) → date 객체로 변환
         start_date = date.fromisoformat(vacation_data['start_date'])
         end_date = date.fromisoformat(vacation_data['end_date'])
 
+        # 검사보다 먼저 잠금 → 동시에 들어온 신청은 앞선 신청이 커밋된 뒤의 상태로 검사됨
+        # 파트 부재 한도가 있으면 같은 파트 다른 구성원의 신청·최종 승인과도 직렬화 (파트 잠금이 먼저)
+        if self._part_absence_limit(user_info.part) is not None:
+            lock_part(user_info.part)
+        lock_user(user_info.id)
+
+        if idempotency_key:
+            previous = self.idempotency_service.get_result(user_info.id, idempotency_key)
+            if previous is not None:
+                db.session.rollback()
+                return previous
+
+        result = self._create_vacation(user_info, vacation_data, start_date, end_date)
+        if not result['success']:
+            db.session.rollback()  # 잠금 해제
+            return result
+
+        if idempotency_key:
+            self.idempotency_service.save_result(user_info.id, idempotency_key, result)
+        db.session.commit()
+        return result
+
+    def _create_vacation(self, user_info, vacation_data, start_date, end_date):
+        """검사 후 휴가·원장·알림을 세션에 추가합니다 (커밋하지 않음)."""
         # 과거 날짜 신청 방지 (오늘은 허용)
         if start_date < date.today():
             return {
@@ -51,12 +107,17 @@ class VacationService:
         if not leave_check['success']:
             return leave_check
 
+        # 파트 동시 부재 한도 (결재 대기 포함)
+        limit_check = self._check_part_absence_limit(user_info.part, start_date, end_date, ACTIVE_STATES)
+        if not limit_check['success']:
+            return limit_check
+
         # 결재 상태 결정 (파트장 본인은 팀장 결재로 바로 올림)
-        status = 'pending_team_leader' if '파트장' in user_info.role else 'pending_part_leader'
+        status = 'pending_team_leader' if user_info.is_part_leader else 'pending_part_leader'
 
         # 저장: date 타입 + FK(applicant_user_id) 동시 기록
         new_vacation = Vacation(
-            applicant=username,                      # 호환 필드
+            applicant=user_info.username,            # 호환 필드
             applicant_user_id=user_info.id,         # FK 사용
             vacation_type=vacation_data['vacation_type'],
             start_date=start_date,
@@ -66,9 +127,10 @@ class VacationService:
             status=status
         )
         db.session.add(new_vacation)
-        db.session.commit()
+        self.leave_balance_service.add_vacation(user_info.id, new_vacation)
+        self.calendar_service.invalidate_after_commit(start_date, end_date)
 
-        # 알림
+        # 알림 (같은 트랜잭션에서 함께 커밋)
         self._send_application_notification(user_info, status)
 
         return {
@@ -77,10 +139,10 @@ class VacationService:
             'type': 'success'
         }
 
-    def cancel_vacation(self, vacation_id, username):
+    def cancel_vacation(self, vacation_id, user_info):
         vacation = Vacation.query.get_or_404(vacation_id)
 
-        if vacation.applicant != username:
+        if vacation.applicant_user_id != user_info.id:
             return {
                 'success': False,
                 'message': "자신이 신청한 휴가만 취소할 수 있습니다.",
@@ -88,7 +150,19 @@ class VacationService:
             }
 
         if vacation.status in PENDING_STATES:
-            db.session.delete(vacation)
+            # 읽은 뒤 결재자가 먼저 처리했으면 삭제하지 않음
+            result = db.session.execute(
+                delete(Vacation)
+                .where(Vacation.id == vacation.id,
+                       Vacation.status == vacation.status,
+                       Vacation.version == vacation.version)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != 1:
+                db.session.rollback()
+                return dict(CONFLICT_RESULT)
+            self.leave_balance_service.remove_vacation(user_info.id, vacation)
+            self.calendar_service.invalidate_after_commit(vacation.start_date, vacation.end_date)
             db.session.commit()
             return {
                 'success': True,
@@ -105,40 +179,106 @@ class VacationService:
     # ----------------------------
     # Approve / Reject
     # ----------------------------
-    def approve_vacation(self, vacation_id, approver_username):
-        approver_user = User.query.filter_by(username=approver_username).first()
+    def approve_vacation(self, vacation_id, approver_user):
         vacation = Vacation.query.get_or_404(vacation_id)
+        return self._process_single(vacation, approver_user, 'approve')
 
-        current_status = vacation.status
-
-        if '팀장' in approver_user.role and current_status == 'pending_team_leader':
-            new_status = 'approved'
-        elif '파트장' in approver_user.role and current_status == 'pending_part_leader':
-            new_status = 'pending_team_leader'
+    def reject_vacation(self, vacation_id, approver_user):
+        vacation = Vacation.query.get_or_404(vacation_id)
+        return self._process_single(vacation, approver_user, 'reject')
+
+    def process_vacations_bulk(self, vacation_ids, approver_user, action):
+        """여러 건을 한 트랜잭션으로 승인/반려합니다.
+
+        권한 확인 1회, IN 쿼리 1회로 대상 조회, 알림 일괄 INSERT, 커밋 1회.
+        반환값: 요청 순서대로 [{'id', 'success', 'message', 'type'}, ...]
+        """
+        vacation_ids = list(dict.fromkeys(vacation_ids))
+        if not approver_user.has_role(RoleFlag.PART_LEADER | RoleFlag.TEAM_LEADER):
+            return [{'id': vid, 'success': False, 'message': "결재 권한이 없습니다.", 'type': 'error'}
+                    for vid in vacation_ids]
+
+        vacations = {v.id: v for v in Vacation.query.filter(Vacation.id.in_(vacation_ids))}
+        if action == 'approve' and approver_user.is_team_leader:
+            self._lock_parts_for_final_approval(vacations.values())
+        outbox = []
+        results = []
+        for vid in vacation_ids:
+            vacation = vacations.get(vid)
+            if vacation is None:
+                result = {'success': False, 'message': "존재하지 않는 휴가 신청입니다.", 'type': 'error'}
+            else:
+                result = self._transition(vacation, approver_user, action, outbox)
+            results.append({'id': vid, **result})
+
+        if any(r['success'] for r in results):
+            self._flush_outbox(outbox)
+            db.session.commit()
+        else:
+            db.session.rollback()  # 잠금 해제
+        return results
+
+    def _lock_parts_for_final_approval(self, vacations):
+        """최종 승인 대상 신청자들의 파트 중 한도가 있는 파트를 이름 순으로 미리 잠급니다.
+
+        _transition 이 건마다 요청 순서대로 잠그면 두 일괄 승인이 서로 다른 순서로 파트를 잡아 교착될 수 있음.
+        """
+        applicant_ids = {v.applicant_user_id for v in vacations if v.status == 'pending_team_leader'}
+        if not applicant_ids:
+            return
+        parts = {part for (part,) in db.session.query(User.part).filter(User.id.in_(applicant_ids)).distinct()}
+        for part in sorted(parts):
+            if self._part_absence_limit(part) is not None:
+                lock_part(part)
+
+    def _process_single(self, vacation, approver_user, action):
+        outbox = []
+        result = self._transition(vacation, approver_user, action, outbox)
+        if result['success']:
+            self._flush_outbox(outbox)
+            db.session.commit()
         else:
+            db.session.rollback()  # 잠금 해제
+        return result
+
+    def _transition(self, vacation, approver_user, action, outbox):
+        """상태 전이 규칙 적용 (커밋하지 않음). 보낼 알림은 outbox 에 (수신자, 메시지)로 쌓습니다."""
+        if action == 'approve':
+            current_status = vacation.status
+
+            if approver_user.is_team_leader and current_status == 'pending_team_leader':
+                new_status = 'approved'
+                # 최종 승인 시점에 이미 승인된 부재만으로 한도 재검사 (신청 이후 다른 건이 먼저 승인됐을 수 있음)
+                applicant_part = (db.session.query(User.part)
+                                  .filter(User.id == vacation.applicant_user_id)
+                                  .scalar())
+                # 같은 파트의 다른 최종 승인·신청이 검사와 상태 변경 사이에 끼어들지 못하게 파트 잠금
+                if self._part_absence_limit(applicant_part) is not None:
+                    lock_part(applicant_part)
+                limit_check = self._check_part_absence_limit(
+                    applicant_part, vacation.start_date, vacation.end_date, ('approved',), exclude_id=vacation.id
+                )
+                if not limit_check['success']:
+                    return limit_check
+            elif approver_user.is_part_leader and current_status == 'pending_part_leader':
+                new_status = 'pending_team_leader'
+            else:
+                return {
+                    'success': False,
+                    'message': "잘못된 접근입니다.",
+                    'type': 'error'
+                }
+
+            if not self._compare_and_set_status(vacation, new_status):
+                return dict(CONFLICT_RESULT)
+            self._queue_approval_notification(vacation, new_status, outbox)
             return {
-                'success': False,
-                'message': "잘못된 접근입니다.",
-                'type': 'error'
+                'success': True,
+                'message': "결재가 승인되었습니다.",
+                'type': 'success'
             }
 
-        vacation.status = new_status
-        db.session.commit()
-
-        # 알림
-        self._send_approval_notification(vacation, new_status)
-
-        return {
-            'success': True,
-            'message': "결재가 승인되었습니다.",
-            'type': 'success'
-        }
-
-    def reject_vacation(self, vacation_id, approver_username):
-        approver_user = User.query.filter_by(username=approver_username).first()
-        vacation = Vacation.query.get_or_404(vacation_id)
-
-        if '파트장' not in approver_user.role and '팀장' not in approver_user.role:
+        if not approver_user.has_role(RoleFlag.PART_LEADER | RoleFlag.TEAM_LEADER):
             return {
                 'success': False,
                 'message': "결재 권한이 없습니다.",
@@ -152,122 +292,244 @@ class VacationService:
                 'type': 'error'
             }
 
-        vacation.status = 'rejected'
-        db.session.commit()
+        if not self._compare_and_set_status(vacation, 'rejected'):
+            return dict(CONFLICT_RESULT)
+        self.leave_balance_service.remove_vacation(vacation.applicant_user_id, vacation)
 
         # 신청자에게 알림
-        applicant_user = self._resolve_applicant_user(vacation)
-        if applicant_user:
-            message = f"휴가 신청({vacation.start_date})이(가) 반려되었습니다."
-            self.notification_service.create_notification(applicant_user.id, message)
-
+        outbox.append((vacation.applicant_user_id,
+                       f"휴가 신청({vacation.start_date})이(가) 반려되었습니다."))
         return {
             'success': True,
             'message': "결재가 반려되었습니다.",
             'type': 'success'
         }
 
+    def _compare_and_set_status(self, vacation, new_status):
+        """읽어 둔 (status, version)이 그대로일 때만 상태를 바꿉니다 (UPDATE ... WHERE id=? AND status=? AND version=?).
+
+        다른 결재자가 먼저 바꿨다면 0행이 갱신되고 False 를 반환합니다.
+        """
+        result = db.session.execute(
+            update(Vacation)
+            .where(Vacation.id == vacation.id,
+                   Vacation.status == vacation.status,
+                   Vacation.version == vacation.version)
+            .values(status=new_status, version=Vacation.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return False
+        # 추가 SELECT 없이 메모리 상의 객체도 맞춰 둠
+        set_committed_value(vacation, 'status', new_status)
+        set_committed_value(vacation, 'version', vacation.version + 1)
+        self.calendar_service.invalidate_after_commit(vacation.start_date, vacation.end_date)
+        return True
+
     # ----------------------------
     # Queries
     # ----------------------------
-    def get_user_vacation_history(self, username):
-        # username으로 조회(호환). FK를 모두 채우면 applicant_user_id 기준으로 바꿔도 됨.
-        return Vacation.query.filter_by(applicant=username).order_by(Vacation.start_date.desc()).all()
-
-    def get_pending_approvals(self, approver_username):
-        """파트장은 동일 파트의 pending_part_leader, 팀장은 모든 pending_team_leader."""
-        approver_user = User.query.filter_by(username=approver_username).first()
-        approval_list = []
-
-        # --- 파트장: 본인 파트 건만 (FK 우선, FK 없는 과거 데이터는 username 조인으로 보완)
-        if '파트장' in approver_user.role:
-            # FK 있는 건: vacations.applicant_user_id = users.id
-            q_fk = (db.session.query(Vacation, User)
-                    .join(User, Vacation.applicant_user_id == User.id)
-                    .filter(and_(Vacation.status == 'pending_part_leader',
-                                 User.part == approver_user.part))
-                    .all())
-            for v, u in q_fk:
-                approval_list.append({'id': v.id, 'applicant': u.username, 'details': v})
-
-            # FK 없는 과거 데이터 보완: username 조인 (applicant_user_id IS NULL)
-            q_legacy = (db.session.query(Vacation, User)
-                        .join(User, User.username == Vacation.applicant)
-                        .filter(and_(Vacation.status == 'pending_part_leader',
-                                     Vacation.applicant_user_id.is_(None),
-                                     User.part == approver_user.part))
-                        .all())
-            # 중복 방지(혹시 모를 케이스)
-            seen = {item['id'] for item in approval_list}
-            for v, u in q_legacy:
-                if v.id not in seen:
-                    approval_list.append({'id': v.id, 'applicant': u.username, 'details': v})
-
-        # --- 팀장: 모든 pending_team_leader
-        if '팀장' in approver_user.role:
-            pending_team = Vacation.query.filter_by(status='pending_team_leader').all()
-            for v in pending_team:
-                approval_list.append({'id': v.id, 'applicant': v.applicant, 'details': v})
-
-        return approval_list
+    @read_only
+    def get_user_vacation_history(self, user_info, cursor=None, limit=AppConfig.PAGE_SIZE):
+        """(start_date, id) 내림차순 keyset 페이지."""
+        query = Vacation.query.filter_by(applicant_user_id=user_info.id)
+        after = decode_cursor(cursor, date, int)
+        if after:
+            query = query.filter(tuple_(Vacation.start_date, Vacation.id) < after)
+        query = query.order_by(Vacation.start_date.desc(), Vacation.id.desc())
+        return keyset_page(query, limit, lambda v: encode_cursor(v.start_date, v.id))
+
+    @read_only
+    def get_pending_approvals(self, approver_user, cursor=None, limit=AppConfig.PAGE_SIZE):
+        """파트장은 동일 파트의 pending_part_leader, 팀장은 모든 pending_team_leader (결재함당 쿼리 1회, id 순 keyset 페이지)."""
+        conditions = []
+        if approver_user.is_part_leader:
+            conditions.append(and_(Vacation.status == 'pending_part_leader',
+                                   User.part == approver_user.part))
+        if approver_user.is_team_leader:
+            conditions.append(Vacation.status == 'pending_team_leader')
+        if not conditions:
+            return Page([], None)
+
+        query = (db.session.query(Vacation, User.username)
+                 .join(User, Vacation.applicant_user_id == User.id)
+                 .filter(or_(*conditions)))
+        after = decode_cursor(cursor, int)
+        if after:
+            query = query.filter(Vacation.id > after[0])
+        page = keyset_page(query.order_by(Vacation.id), limit, lambda row: encode_cursor(row[0].id))
+        return Page([{'id': v.id, 'applicant': applicant, 'details': v} for v, applicant in page.items],
+                    page.next_cursor)
+
+    def iter_vacation_export(self, date_from=None, date_to=None, status='approved', batch_size=1000):
+        """기간과 겹치는 휴가를 EXPORT_COLUMNS 순서의 튜플로 하나씩 내보냅니다 (status='all' 이면 전체 상태).
+
+        사용자와 조인한 단일 쿼리를 yield_per 로 batch_size 행씩 읽으므로(서버 측 커서를 지원하는 DB 는 stream_results)
+        여러 해, 수천 명 분량이어도 메모리 사용량이 일정합니다.
+        """
+        stmt = (select(Vacation.id, User.employee_number, User.username, User.part, Vacation.vacation_type,
+                       Vacation.start_date, Vacation.end_date, Vacation.status)
+                .join(User, User.id == Vacation.applicant_user_id)
+                .order_by(Vacation.start_date, Vacation.id)
+                .execution_options(yield_per=batch_size))
+        if status != 'all':
+            stmt = stmt.where(Vacation.status == status)
+        if date_from:
+            stmt = stmt.where(Vacation.end_date >= date_from)
+        if date_to:
+            stmt = stmt.where(Vacation.start_date <= date_to)
+
+        holiday_calendar = get_holiday_calendar()
+        for row in db.session.execute(stmt):
+            leave_days = sum(self.calculator.leave_days_by_year(
+                row.vacation_type, row.start_date, row.end_date, holiday_calendar).values())
+            yield (row.id, row.employee_number, row.username, row.part, row.vacation_type,
+                   row.start_date.isoformat(), row.end_date.isoformat(), leave_days, row.status)
+
+    def backfill_applicant_user_ids(self, chunk_size=1000):
+        """applicant_user_id 가 비어 있는 과거 행을 username 으로 채웁니다.
+
+        id 순 chunk 단위로 커밋하므로 중간에 끊겨도 다시 실행하면 남은 행부터 이어서 처리합니다.
+        반환값: (채운 행 수, 대응하는 사용자가 없는 행 id 리스트)
+        """
+        filled = 0
+        unmatched = []
+        last_id = 0
+        while True:
+            ids = [vid for (vid,) in (db.session.query(Vacation.id)
+                                      .filter(Vacation.applicant_user_id.is_(None), Vacation.id > last_id)
+                                      .order_by(Vacation.id)
+                                      .limit(chunk_size))]
+            if not ids:
+                break
+            last_id = ids[-1]
+
+            user_id = (db.session.query(User.id)
+                       .filter(User.username == Vacation.applicant)
+                       .scalar_subquery())
+            result = db.session.execute(
+                update(Vacation)
+                .where(Vacation.id.in_(ids))
+                .values(applicant_user_id=user_id)
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+            filled += result.rowcount
+
+            unmatched.extend(vid for (vid,) in (db.session.query(Vacation.id)
+                                                .filter(Vacation.id.in_(ids),
+                                                        Vacation.applicant_user_id.is_(None))))
+        filled -= len(unmatched)
+        return filled, unmatched
 
     # ----------------------------
     # Internal helpers
     # ----------------------------
     def _check_vacation_overlap(self, user_info, new_start_date: date, new_end_date: date):
-        """동일 사용자의 승인/대기 중인 휴가와 기간 겹침 방지 (date 타입 비교)."""
-        existing_vacations = (Vacation.query
-                              .filter(or_(Vacation.applicant_user_id == user_info.id,
-                                          Vacation.applicant == user_info.username))
-                              .all())
-        for v in existing_vacations:
-            if v.status in PENDING_STATES + ('approved',):
-                # v.start_date / v.end_date 는 date 타입
-                if not (new_end_date < v.start_date or new_start_date > v.end_date):
-                    return {
-                        'success': False,
-                        'message': "해당 기간에 이미 신청된 휴가가 있습니다.",
-                        'type': 'error'
-                    }
+        """동일 사용자의 승인/대기 중인 휴가와 기간 겹침 방지 (단일 EXISTS 쿼리, 복합 인덱스 사용)."""
+        overlapping = (db.session.query(Vacation.id)
+                       .filter(Vacation.applicant_user_id == user_info.id,
+                               Vacation.status.in_(ACTIVE_STATES),
+                               Vacation.start_date <= new_end_date,
+                               Vacation.end_date >= new_start_date)
+                       .exists())
+
+        if db.session.query(overlapping).scalar():
+            return {
+                'success': False,
+                'message': "해당 기간에 이미 신청된 휴가가 있습니다.",
+                'type': 'error'
+            }
         return {'success': True}
 
     def _check_annual_leave_balance(self, user_info, vacation_data, start_date: date, end_date: date):
+        """원장(leave_balances)의 연차 연도별 사용량 한 행만 읽어 잔여 연차를 확인합니다."""
         total_annual_leave = self.calculator.calculate_annual_leave(user_info.join_date)
-        used_annual_leave = self._calculate_used_annual_leave(user_info)
-
-        vtype = vacation_data['vacation_type']
-        if vtype == 'annual':
-            requested_days = (end_date - start_date).days + 1
-        elif vtype in ('am_half_day', 'pm_half_day'):
-            requested_days = 0.5
-        else:
-            requested_days = 0
 
-        if used_annual_leave + requested_days > total_annual_leave:
-            remaining = total_annual_leave - used_annual_leave
+        requested = self.calculator.leave_days_by_year(vacation_data['vacation_type'], start_date, end_date)
+        if requested and not any(requested.values()):
             return {
                 'success': False,
-                'message': f"연차 신청 가능 일수를 초과했습니다. 현재 신청 가능한 잔여 연차: {remaining}일",
+                'message': "선택한 기간은 모두 주말 또는 공휴일입니다.",
                 'type': 'error'
             }
+
+        for leave_year, requested_days in requested.items():
+            used_annual_leave = self.leave_balance_service.get_used_days(user_info.id, leave_year)
+            if used_annual_leave + requested_days > total_annual_leave:
+                remaining = total_annual_leave - used_annual_leave
+                return {
+                    'success': False,
+                    'message': f"연차 신청 가능 일수를 초과했습니다. 현재 신청 가능한 잔여 연차: {remaining}일",
+                    'type': 'error'
+                }
         return {'success': True}
 
-    def _calculate_used_annual_leave(self, user_info):
-        """승인되었거나 진행 중인(대기 포함) 연차 소모량 계산."""
-        existing_vacations = (Vacation.query
-                              .filter(or_(Vacation.applicant_user_id == user_info.id,
-                                          Vacation.applicant == user_info.username))
-                              .all())
-        used_days = 0.0
-        for v in existing_vacations:
-            if v.status in PENDING_STATES + ('approved',):
-                if v.vacation_type == 'annual':
-                    used_days += (v.end_date - v.start_date).days + 1
-                elif v.vacation_type in ('am_half_day', 'pm_half_day'):
-                    used_days += 0.5
-        return used_days
+    def _part_absence_limit(self, part):
+        """파트의 동시 부재 인원 한도 (None 이면 제한 없음)."""
+        return current_app.config['PART_ABSENCE_LIMITS'].get(part, current_app.config['DEFAULT_PART_ABSENCE_LIMIT'])
+
+    def _check_part_absence_limit(self, part, start_date: date, end_date: date, states, exclude_id=None):
+        """파트의 날짜별 부재 인원(+1)이 한도를 넘는지 확인합니다.
+
+        겹치는 휴가를 한 번의 범위 쿼리로 읽고 difference array 로 날짜별 인원을 셉니다 (반차도 1명).
+        """
+        limit = self._part_absence_limit(part)
+        if limit is None:
+            return {'success': True}
+
+        query = (db.session.query(Vacation.start_date, Vacation.end_date)
+                 .join(User, User.id == Vacation.applicant_user_id)
+                 .filter(User.part == part,
+                         Vacation.status.in_(states),
+                         Vacation.start_date <= end_date,
+                         Vacation.end_date >= start_date))
+        if exclude_id is not None:
+            query = query.filter(Vacation.id != exclude_id)
+
+        counts = day_counts(query.all(), start_date, end_date)
+        busiest = int(counts.argmax())
+        if counts[busiest] + 1 > limit:
+            busiest_day = start_date + timedelta(days=busiest)
+            return {
+                'success': False,
+                'message': f"{busiest_day}에 {part} 파트의 동시 부재 인원이 한도({limit}명)를 초과합니다.",
+                'type': 'error'
+            }
+        return {'success': True}
 
     def _send_application_notification(self, user_info, status):
         if status == 'pending_team_leader':
             # 팀장에게 알림
-            team_le_
+            recipients = db.session.query(User.id).filter(User.role_filter(RoleFlag.TEAM_LEADER))
+        else:
+            # 같은 파트의 파트장에게 알림
+            recipients = db.session.query(User.id).filter(User.part == user_info.part,
+                                                          User.role_filter(RoleFlag.PART_LEADER))
+
+        message = f"{user_info.username}님의 휴가 신청이 결재 대기 중입니다."
+        self.notification_service.create_notifications([uid for (uid,) in recipients], message)
+
+    def _queue_approval_notification(self, vacation, new_status, outbox):
+        if new_status == 'approved':
+            outbox.append((vacation.applicant_user_id,
+                           f"휴가 신청({vacation.start_date})이(가) 최종 승인되었습니다."))
+        elif new_status == 'pending_team_leader':
+            outbox.append((vacation.applicant_user_id,
+                           f"휴가 신청({vacation.start_date})이(가) 파트장 승인되어 팀장 결재 대기 중입니다."))
+            # 팀장에게 결재 요청 알림 (수신자는 _flush_outbox 에서 한 번만 조회)
+            outbox.append((TEAM_LEADERS, f"{vacation.applicant}님의 휴가 신청이 결재 대기 중입니다."))
+
+    def _flush_outbox(self, outbox):
+        """outbox 의 알림을 INSERT 한 번으로 기록합니다 (커밋하지 않음)."""
+        team_leader_ids = None
+        rows = []
+        for recipient, message in outbox:
+            if recipient is TEAM_LEADERS:
+                if team_leader_ids is None:
+                    team_leader_ids = [uid for (uid,) in db.session.query(User.id)
+                                       .filter(User.role_filter(RoleFlag.TEAM_LEADER))]
+                rows.extend((uid, message) for uid in team_leader_ids)
+            else:
+                rows.append((recipient, message))
+        self.notification_service.create_notification_rows(rows)
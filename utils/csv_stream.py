@@ -0,0 +1,15 @@
+# utils/csv_stream.py
+import csv
+import io
+from itertools import chain
+
+
+def iter_csv(header, rows):
+    """header 와 rows 를 CSV 텍스트 한 줄씩 내보냅니다 (전체를 메모리에 모으지 않음)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for values in chain([header], rows):
+        writer.writerow(values)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
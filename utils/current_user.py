@@ -0,0 +1,33 @@
+# utils/current_user.py
+from flask import g
+from exceptions import AuthenticationError
+from models import User, db
+from utils.principal import end_session, forget, load_principal
+
+
+def get_current_principal():
+    """세션 principal 을 요청당 한 번만 검증해 flask.g에 캐시합니다 (DB 조회 없음, 인가 판단용)."""
+    if '_current_principal' not in g:
+        g._current_principal = load_principal()
+    return g._current_principal
+
+
+def get_current_user():
+    """principal 의 사용자 행을 요청당 한 번만 조회해 flask.g에 캐시합니다.
+
+    데코레이터와 컨텍스트 프로세서는 principal 만 쓰고, 사용자 객체가 필요한 라우트 핸들러만
+    이 함수를 호출하므로 사용자 조회 쿼리는 요청당 많아야 한 번(기본키 조회)입니다.
+
+    principal 은 유효한데 사용자 행이 없으면(다른 워커에서 삭제된 직후, AUTH_VERSION_TTL 이내)
+    세션을 비우고 AuthenticationError 를 발생시킵니다 (app 에서 로그인 화면으로 리다이렉트).
+    """
+    if '_current_user' not in g:
+        principal = get_current_principal()
+        user = db.session.get(User, principal.user_id) if principal else None
+        if principal and user is None:
+            forget(principal.user_id)
+            end_session()
+            g._current_principal = None
+            raise AuthenticationError("세션의 사용자가 존재하지 않습니다.")
+        g._current_user = user
+    return g._current_user
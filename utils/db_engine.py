@@ -0,0 +1,30 @@
+# utils/db_engine.py
+"""DB 엔진 프로필 적용 (config.DB_ENGINE_PROFILES).
+
+엔진 옵션(풀 크기 등)은 SQLALCHEMY_ENGINE_OPTIONS 로 Flask-SQLAlchemy 가 적용하고,
+여기서는 옵션으로 줄 수 없는 SQLite PRAGMA 를 새 연결마다 실행하도록 연결 이벤트를 겁니다.
+"""
+from sqlalchemy import event
+
+from models import db
+
+
+def init_db_engine(app):
+    if app.config.get('DB_PROFILE') != 'sqlite':
+        return
+    pragmas = app.config['SQLITE_PRAGMAS']
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name == 'sqlite':
+                event.listen(engine, 'connect', _sqlite_pragmas_listener(pragmas))
+
+
+def _sqlite_pragmas_listener(pragmas):
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+    return set_pragmas
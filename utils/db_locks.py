@@ -0,0 +1,40 @@
+# utils/db_locks.py
+from sqlalchemy import func, select
+from models import User, db
+
+
+def lock_user(user_id):
+    """현재 트랜잭션이 끝날 때(커밋/롤백)까지 같은 사용자에 대한 다른 쓰기를 기다리게 합니다.
+
+    - SQLite: 행 잠금이 없으므로 BEGIN IMMEDIATE 로 DB 쓰기 잠금을 먼저 잡음
+    - 그 외(PostgreSQL 등): SELECT ... FOR UPDATE 로 사용자 행을 잠금
+    """
+    if _begin_immediate_on_sqlite():
+        return
+    db.session.execute(select(User.id).where(User.id == user_id).with_for_update())
+
+
+def lock_part(part):
+    """현재 트랜잭션이 끝날 때까지 같은 파트의 동시 부재 한도 검사·저장을 직렬화합니다.
+
+    잠금 키는 파트 이름에서만 만들므로 파트 구성원이 바뀌어도 같은 파트는 항상 같은 잠금을 씁니다.
+    - SQLite: lock_user 와 같이 BEGIN IMMEDIATE
+    - PostgreSQL: pg_advisory_xact_lock(hashtext(part)) (같은 트랜잭션에서 다시 잡아도 됨)
+    여러 파트를 잠글 때는 교착을 피하도록 정렬된 순서로, lock_user 보다 먼저 호출합니다.
+    """
+    if _begin_immediate_on_sqlite():
+        return
+    connection = db.session.connection()
+    if connection.dialect.name != 'postgresql':
+        raise NotImplementedError(f"{connection.dialect.name} 에서는 파트 잠금을 지원하지 않습니다.")
+    db.session.execute(select(func.pg_advisory_xact_lock(func.hashtext(part))))
+
+
+def _begin_immediate_on_sqlite():
+    connection = db.session.connection()
+    if connection.dialect.name != 'sqlite':
+        return False
+    # 이미 쓰기를 실행한 트랜잭션이면 쓰기 잠금을 쥐고 있으므로 그대로 둠
+    if not connection.connection.dbapi_connection.in_transaction:
+        connection.exec_driver_sql('BEGIN IMMEDIATE')
+    return True
@@ -0,0 +1,85 @@
+# utils/db_routing.py
+"""읽기 전용 복제본(replica) 라우팅.
+
+REPLICA_DATABASE_URL 이 설정되면 SQLALCHEMY_BINDS['replica'] 엔진이 생기고, @read_only 서비스 메서드 안의
+SELECT 만 복제본으로 보냅니다. 다음 경우는 항상 primary 를 씁니다.
+- 같은 세션(요청)에서 이미 쓰기(flush, INSERT/UPDATE/DELETE)를 한 뒤의 읽기
+- 쓰기를 커밋한 뒤 REPLICA_STICKY_SECONDS 동안 같은 브라우저 세션의 읽기 (복제 지연 동안 자기 쓰기가 안 보이는 문제 방지)
+
+models 가 이 모듈을 임포트하므로 여기서는 models 를 임포트하지 않습니다.
+"""
+import time
+from functools import wraps
+
+from flask import current_app, has_request_context, session as http_session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql.dml import UpdateBase
+
+
+REPLICA_BIND = 'replica'
+_READ_ONLY_KEY = 'read_only'
+_WROTE_KEY = 'wrote_primary'
+_STICKY_SESSION_KEY = 'primary_until'
+
+
+class RoutingSession(Session):
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and isinstance(clause, UpdateBase):
+            self.info[_WROTE_KEY] = True
+        elif (bind is None and self.info.get(_READ_ONLY_KEY) and not self.info.get(_WROTE_KEY)
+              and not self._flushing):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _mark_wrote(session, flush_context):
+    session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _stick_to_primary(session):
+    if not session.info.get(_WROTE_KEY) or not has_request_context():
+        return
+    if REPLICA_BIND in session._db.engines:
+        http_session[_STICKY_SESSION_KEY] = time.time() + current_app.config['REPLICA_STICKY_SECONDS']
+
+
+def read_only(f):
+    """서비스 메서드의 조회를 복제본으로 보냅니다 (복제본이 없거나 primary 고정 중이면 primary)."""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        db_session = current_app.extensions['sqlalchemy'].session()
+        if db_session.info.get(_READ_ONLY_KEY) or _sticky():
+            return f(*args, **kwargs)
+        db_session.info[_READ_ONLY_KEY] = True
+        try:
+            return f(*args, **kwargs)
+        finally:
+            db_session.info.pop(_READ_ONLY_KEY, None)
+    return decorated_function
+
+
+def _sticky():
+    return has_request_context() and http_session.get(_STICKY_SESSION_KEY, 0) > time.time()
+
+
+def sync_sqlite_replica(primary_engine, replica_engine):
+    """로컬 개발용 복제 대역: SQLite 온라인 백업 API로 primary 파일 전체를 replica 파일에 복사합니다.
+
+    복사 중에도 양쪽 모두 읽기·쓰기가 가능하고, replica 는 복사가 끝난 시점에 한 번에 바뀝니다.
+    반환값: 복사한 페이지 수
+    """
+    if primary_engine.dialect.name != 'sqlite' or replica_engine.dialect.name != 'sqlite':
+        raise ValueError("sync-replica 는 SQLite primary/replica 에서만 사용할 수 있습니다.")
+    source = primary_engine.raw_connection()
+    target = replica_engine.raw_connection()
+    try:
+        source.driver_connection.backup(target.driver_connection)
+        return source.driver_connection.execute("PRAGMA page_count").fetchone()[0]
+    finally:
+        target.close()
+        source.close()
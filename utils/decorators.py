@@ -1,13 +1,13 @@
 # utils/decorators.py
 from functools import wraps
-from flask import session, redirect, url_for
-from models import User
+from flask import redirect, url_for
+from utils.current_user import get_current_principal
 
 
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if 'username' not in session:
+        if get_current_principal() is None:
             return redirect(url_for('login'))
         return f(*args, **kwargs)
     return decorated_function
@@ -16,12 +16,11 @@ def login_required(f):
 def admin_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        username = session.get('username')
-        if not username:
+        principal = get_current_principal()
+        if principal is None:
             return redirect(url_for('login'))
-        
-        user_info = User.query.filter_by(username=username).first()
-        if not user_info or '팀장' not in user_info.role:
+
+        if not principal.is_team_leader:
             return "관리자 권한이 없습니다.", 403
         
         return f(*args, **kwargs)
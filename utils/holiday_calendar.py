@@ -0,0 +1,69 @@
+# utils/holiday_calendar.py
+import csv
+import os
+from datetime import date
+
+import numpy as np
+from flask import current_app
+
+
+class HolidayCalendar:
+    """근무일 계산기.
+
+    연도별로 근무일 비트맵(주말·공휴일 = 0)을 한 번 만들고 누적합을 저장해 두어,
+    임의 구간의 근무일 수를 연도당 O(1)로 셉니다. 비트맵은 처음 필요할 때 연도 단위로 만듭니다.
+    """
+
+    def __init__(self, holidays=()):
+        self.holidays = frozenset(holidays)
+        self._prefix = {}  # year → 누적 근무일 수 배열 (길이 = 그 해 일수 + 1)
+
+    def _year_prefix(self, year):
+        prefix = self._prefix.get(year)
+        if prefix is None:
+            first = date(year, 1, 1)
+            size = (date(year + 1, 1, 1) - first).days
+            working = (first.weekday() + np.arange(size)) % 7 < 5
+            for holiday in self.holidays:
+                if holiday.year == year:
+                    working[(holiday - first).days] = False
+            prefix = np.concatenate(([0], np.cumsum(working)))
+            self._prefix[year] = prefix
+        return prefix
+
+    def working_days(self, start_date, end_date):
+        """start_date ~ end_date(양 끝 포함)의 근무일 수."""
+        total = 0
+        for year in range(start_date.year, end_date.year + 1):
+            first = date(year, 1, 1)
+            lo = (max(start_date, first) - first).days
+            hi = (min(end_date, date(year, 12, 31)) - first).days
+            if lo <= hi:
+                prefix = self._year_prefix(year)
+                total += int(prefix[hi + 1] - prefix[lo])
+        return total
+
+    def is_working_day(self, day):
+        return self.working_days(day, day) == 1
+
+
+def load_holidays(path):
+    """'date,name' CSV(# 주석 허용)에서 휴일 날짜 목록을 읽습니다."""
+    with open(path, encoding='utf-8') as f:
+        rows = csv.DictReader(line for line in f if not line.startswith('#'))
+        return [date.fromisoformat(row['date']) for row in rows]
+
+
+def init_holiday_calendar(app):
+    path = app.config['HOLIDAY_FILE']
+    if not os.path.isabs(path):
+        path = os.path.join(app.root_path, path)
+    holidays = load_holidays(path)
+    holidays.extend(date.fromisoformat(d) for d in app.config['COMPANY_HOLIDAYS'])
+    calendar = HolidayCalendar(holidays)
+    app.extensions['holiday_calendar'] = calendar
+    return calendar
+
+
+def get_holiday_calendar():
+    return current_app.extensions['holiday_calendar']
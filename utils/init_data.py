@@ -1,6 +1,7 @@
 # utils/init_data.py
 from werkzeug.security import generate_password_hash
 from models import db, User, Vacation, Notification
+from constants import RoleFlag
 from datetime import date, timedelta
 import random
 
@@ -249,9 +250,9 @@ def print_user_info():
     users = User.query.order_by(User.id.asc()).all()
 
     # 역할별 그룹화
-    team_leaders = [u for u in users if '팀장' in u.role]
-    part_leaders = [u for u in users if '파트장' in u.role]
-    members = [u for u in users if u.role == '팀원']
+    team_leaders = [u for u in users if u.is_team_leader]
+    part_leaders = [u for u in users if u.is_part_leader]
+    members = [u for u in users if u.role_flags == RoleFlag.MEMBER]
 
     def pw_of(u):
         return "a123456!" if u.is_temp_password else "password123!"
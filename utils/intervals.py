@@ -0,0 +1,48 @@
+# utils/intervals.py
+"""날짜 구간(양 끝 포함) 집계.
+
+- day_counts: NumPy difference array(np.add.at) + 누적합(np.cumsum)으로 날짜별 겹침 수
+- day_buckets: 날짜별로 겹치는 값 목록 (결과 크기 자체가 구간 길이 합이므로 파이썬 루프)
+"""
+import numpy as np
+
+
+def _clip(start, end, range_start, size):
+    """구간을 [range_start, range_start + size) 안의 인덱스 범위로 자릅니다. 겹치지 않으면 None."""
+    lo = max((start - range_start).days, 0)
+    hi = min((end - range_start).days, size - 1)
+    return (lo, hi) if lo <= hi else None
+
+
+def day_counts(intervals, range_start, range_end):
+    """range_start ~ range_end 의 날짜별로 겹치는 구간 수를 정수 배열로 반환합니다.
+
+    intervals: (start_date, end_date) 쌍의 iterable
+    """
+    size = (range_end - range_start).days + 1
+    origin = range_start.toordinal()
+    bounds = np.fromiter((d.toordinal() - origin for interval in intervals for d in interval[:2]),
+                         dtype=np.int64).reshape(-1, 2)
+    lo = np.maximum(bounds[:, 0], 0)
+    hi = np.minimum(bounds[:, 1], size - 1)
+    overlaps = lo <= hi
+
+    diff = np.zeros(size + 1, dtype=np.int64)
+    np.add.at(diff, lo[overlaps], 1)
+    np.add.at(diff, hi[overlaps] + 1, -1)
+    return np.cumsum(diff[:size])
+
+
+def day_buckets(items, range_start, range_end):
+    """range_start ~ range_end 의 날짜별로 겹치는 value 리스트를 반환합니다.
+
+    items: (start_date, end_date, value) 의 iterable
+    """
+    size = (range_end - range_start).days + 1
+    buckets = [[] for _ in range(size)]
+    for start, end, value in items:
+        clipped = _clip(start, end, range_start, size)
+        if clipped:
+            for i in range(clipped[0], clipped[1] + 1):
+                buckets[i].append(value)
+    return buckets
@@ -0,0 +1,174 @@
+# utils/login_throttle.py
+"""로그인 시도 제한 (토큰 버킷).
+
+아이디별·IP별 버킷에서 시도마다 토큰 1개를 쓰고, 토큰은 분당 rate 개씩 burst 개까지 다시 찹니다.
+DB 조회와 비밀번호 해시 전에 검사하므로 무차별 대입·재시도 루프가 해시 워커를 점유하지 못합니다.
+
+- MemoryLoginThrottle: 프로세스 내부 dict (워커 1개일 때)
+- SQLiteLoginThrottle: 로컬 SQLite 파일을 공유해 여러 워커 프로세스가 같은 버킷을 씀 (메인 DB는 건드리지 않음)
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+from flask import current_app
+
+
+# 버킷 키 길이 제한 (아무 문자열이나 보내 키를 부풀리지 못하게)
+MAX_KEY_LENGTH = 64
+
+
+class MemoryLoginThrottle:
+    def __init__(self, username_limit, ip_limit, max_keys=100000):
+        """username_limit, ip_limit: (burst, 분당 rate)"""
+        self.limits = {'username': username_limit, 'ip': ip_limit}
+        self.max_keys = max_keys
+        self._buckets = {}  # key -> (tokens, updated_at)
+        self._counters = Counter()
+        self._lock = threading.Lock()
+
+    def check(self, username, ip):
+        """시도 1회를 기록합니다. 허용이면 None, 거절이면 (거절 기준 'username'|'ip', 재시도까지 초)."""
+        keys = self._keys(username, ip)
+        now = time.monotonic()
+        with self._lock:
+            rejected = self._take(keys, self._buckets.get, self._store, now)
+            if rejected is None:
+                self._counters['allowed'] += 1
+            else:
+                self._counters['rejected_' + rejected[0]] += 1
+            if len(self._buckets) > self.max_keys:
+                self._prune(now)
+        return rejected
+
+    def stats(self):
+        with self._lock:
+            return {'allowed': self._counters['allowed'],
+                    'rejected_username': self._counters['rejected_username'],
+                    'rejected_ip': self._counters['rejected_ip'],
+                    'tracked_keys': len(self._buckets)}
+
+    def _keys(self, username, ip):
+        return [('username', 'u:' + (username or '').strip().lower()[:MAX_KEY_LENGTH]),
+                ('ip', 'i:' + (ip or '')[:MAX_KEY_LENGTH])]
+
+    def _take(self, keys, load, store, now):
+        """모든 버킷에 토큰이 있을 때만 한꺼번에 1개씩 씁니다 (하나라도 부족하면 아무것도 쓰지 않음)."""
+        refilled = []
+        for scope, key in keys:
+            burst, rate = self.limits[scope]
+            tokens, updated_at = load(key) or (burst, now)
+            tokens = min(burst, tokens + (now - updated_at) * rate / 60)
+            if tokens < 1:
+                return scope, int((1 - tokens) * 60 / rate) + 1
+            refilled.append((key, tokens))
+        for key, tokens in refilled:
+            store(key, tokens - 1, now)
+        return None
+
+    def _store(self, key, tokens, now):
+        self._buckets[key] = (tokens, now)
+
+    def _prune(self, now):
+        # 다 찬 버킷은 없는 것과 같으므로 먼저 버리고, 그래도 넘치면 오래된 것부터
+        full = [key for key, (tokens, updated_at) in self._buckets.items()
+                if tokens + (now - updated_at) * self._rate_of(key) / 60 >= self._burst_of(key)]
+        for key in full:
+            del self._buckets[key]
+        for key in list(self._buckets)[:len(self._buckets) - self.max_keys]:
+            del self._buckets[key]
+
+    def _burst_of(self, key):
+        return self.limits['username' if key.startswith('u:') else 'ip'][0]
+
+    def _rate_of(self, key):
+        return self.limits['username' if key.startswith('u:') else 'ip'][1]
+
+
+class SQLiteLoginThrottle(MemoryLoginThrottle):
+    """버킷과 카운터를 SQLite 파일에 두어 워커 프로세스 간에 공유합니다."""
+
+    PRUNE_EVERY = 1000  # 이 횟수마다 다 찬 버킷 행을 정리
+
+    def __init__(self, path, username_limit, ip_limit):
+        super().__init__(username_limit, ip_limit)
+        self.path = path
+        self._calls = 0
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS buckets ("
+                         " key TEXT PRIMARY KEY,"
+                         " tokens REAL NOT NULL,"
+                         " updated_at REAL NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS counters ("
+                         " name TEXT PRIMARY KEY,"
+                         " value INTEGER NOT NULL)")
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def check(self, username, ip):
+        keys = self._keys(username, ip)
+        # 프로세스 간에 비교해야 하므로 monotonic 대신 벽시계 시간
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+
+            def load(key):
+                return conn.execute("SELECT tokens, updated_at FROM buckets WHERE key = ?", (key,)).fetchone()
+
+            def store(key, tokens, updated_at):
+                conn.execute("INSERT INTO buckets (key, tokens, updated_at) VALUES (?, ?, ?)"
+                             " ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens,"
+                             " updated_at = excluded.updated_at", (key, tokens, updated_at))
+
+            rejected = self._take(keys, load, store, now)
+            name = 'allowed' if rejected is None else 'rejected_' + rejected[0]
+            conn.execute("INSERT INTO counters (name, value) VALUES (?, 1)"
+                         " ON CONFLICT(name) DO UPDATE SET value = value + 1", (name,))
+            self._calls += 1
+            if self._calls % self.PRUNE_EVERY == 0:
+                self._prune_rows(conn, now)
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return rejected
+
+    def stats(self):
+        with self._connect() as conn:
+            counters = dict(conn.execute("SELECT name, value FROM counters"))
+            tracked = conn.execute("SELECT COUNT(*) FROM buckets").fetchone()[0]
+        return {'allowed': counters.get('allowed', 0),
+                'rejected_username': counters.get('rejected_username', 0),
+                'rejected_ip': counters.get('rejected_ip', 0),
+                'tracked_keys': tracked}
+
+    def _prune_rows(self, conn, now):
+        for scope, prefix in (('username', 'u:%'), ('ip', 'i:%')):
+            burst, rate = self.limits[scope]
+            conn.execute("DELETE FROM buckets WHERE key LIKE ? AND updated_at < ?",
+                         (prefix, now - burst * 60 / rate))
+
+
+def init_login_throttle(app):
+    username_limit = (app.config['LOGIN_THROTTLE_USERNAME_BURST'], app.config['LOGIN_THROTTLE_USERNAME_RATE'])
+    ip_limit = (app.config['LOGIN_THROTTLE_IP_BURST'], app.config['LOGIN_THROTTLE_IP_RATE'])
+    if app.config.get('LOGIN_THROTTLE_BACKEND') == 'sqlite':
+        # 상대 경로는 instance 폴더 기준 (알림 브로커와 동일)
+        path = app.config['LOGIN_THROTTLE_PATH']
+        if not os.path.isabs(path):
+            os.makedirs(app.instance_path, exist_ok=True)
+            path = os.path.join(app.instance_path, path)
+        throttle = SQLiteLoginThrottle(path, username_limit, ip_limit)
+    else:
+        throttle = MemoryLoginThrottle(username_limit, ip_limit)
+    app.extensions['login_throttle'] = throttle
+    return throttle
+
+
+def get_login_throttle():
+    return current_app.extensions['login_throttle']
@@ -0,0 +1,131 @@
+# utils/notification_broker.py
+"""알림 실시간 전달용 pub/sub.
+
+- MemoryBroker: 프로세스 내부 전달 (워커 1개일 때)
+- SQLiteBroker: 로컬 SQLite 파일을 공유 이벤트 로그로 사용해 여러 워커 프로세스에 fan-out
+  (각 프로세스의 폴링 스레드 하나가 새 이벤트를 읽어 자기 구독자에게 전달하며, 메인 DB는 건드리지 않음)
+"""
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+from flask import current_app
+
+from utils.transaction_hooks import on_commit
+
+
+class MemoryBroker:
+    def __init__(self, max_queue_size=100):
+        self.max_queue_size = max_queue_size
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        q = queue.Queue(maxsize=self.max_queue_size)
+        with self._lock:
+            self._subscribers[user_id].add(q)
+        return q
+
+    def unsubscribe(self, user_id, q):
+        with self._lock:
+            subscribers = self._subscribers.get(user_id)
+            if subscribers:
+                subscribers.discard(q)
+                if not subscribers:
+                    del self._subscribers[user_id]
+
+    def publish(self, user_ids, payload):
+        self._deliver(user_ids, payload)
+
+    def _deliver(self, user_ids, payload):
+        with self._lock:
+            targets = [q for user_id in user_ids for q in self._subscribers.get(user_id, ())]
+        for q in targets:
+            try:
+                q.put_nowait(payload)
+            except queue.Full:
+                pass  # 느린 구독자는 이벤트를 건너뜀 (다음 새로고침 때 DB 값으로 맞춰짐)
+
+
+class SQLiteBroker(MemoryBroker):
+    RETENTION_SECONDS = 60
+
+    def __init__(self, path, poll_interval=0.5, max_queue_size=100):
+        super().__init__(max_queue_size)
+        self.path = path
+        self.poll_interval = poll_interval
+        self._poller = None
+        self._last_id = None
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS events ("
+                         " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                         " user_id INTEGER NOT NULL,"
+                         " payload TEXT NOT NULL,"
+                         " created_at REAL NOT NULL)")
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def subscribe(self, user_id):
+        self._ensure_poller()
+        return super().subscribe(user_id)
+
+    def publish(self, user_ids, payload):
+        data = json.dumps(payload, ensure_ascii=False)
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany("INSERT INTO events (user_id, payload, created_at) VALUES (?, ?, ?)",
+                             [(user_id, data, now) for user_id in user_ids])
+            conn.execute("DELETE FROM events WHERE created_at < ?", (now - self.RETENTION_SECONDS,))
+
+    def _ensure_poller(self):
+        with self._lock:
+            if self._poller is not None:
+                return
+            with self._connect() as conn:
+                self._last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+            self._poller = threading.Thread(target=self._poll, name='notification-broker', daemon=True)
+            self._poller.start()
+
+    def _poll(self):
+        conn = self._connect()
+        while True:
+            rows = conn.execute("SELECT id, user_id, payload FROM events WHERE id > ? ORDER BY id",
+                                (self._last_id,)).fetchall()
+            for event_id, user_id, data in rows:
+                self._last_id = event_id
+                self._deliver((user_id,), json.loads(data))
+            time.sleep(self.poll_interval)
+
+
+def init_notification_broker(app):
+    if app.config.get('NOTIFICATION_BROKER') == 'sqlite':
+        # 상대 경로는 instance 폴더 기준 (SQLite DB 파일과 같은 위치)
+        path = app.config['NOTIFICATION_BROKER_PATH']
+        if not os.path.isabs(path):
+            os.makedirs(app.instance_path, exist_ok=True)
+            path = os.path.join(app.instance_path, path)
+        broker = SQLiteBroker(path)
+    else:
+        broker = MemoryBroker()
+    app.extensions['notification_broker'] = broker
+    return broker
+
+
+def get_broker():
+    return current_app.extensions['notification_broker']
+
+
+def publish_after_commit(user_ids, payload):
+    """트랜잭션이 커밋되면 user_ids 구독자에게 payload 를 발행합니다."""
+    broker = current_app.extensions.get('notification_broker')
+    if broker is None or not user_ids:
+        return
+    user_ids = list(user_ids)
+    on_commit(lambda: broker.publish(user_ids, payload))
@@ -0,0 +1,37 @@
+# utils/pagination.py
+from collections import namedtuple
+from datetime import date, datetime
+
+# items: 현재 페이지 행들, next_cursor: 다음 페이지 커서(마지막 페이지면 None)
+Page = namedtuple('Page', ['items', 'next_cursor'])
+
+_SEP = '~'
+
+
+def encode_cursor(*values):
+    """정렬 키 값들을 URL에 실을 수 있는 문자열로 변환합니다."""
+    return _SEP.join(v.isoformat() if isinstance(v, (date, datetime)) else str(v) for v in values)
+
+
+def decode_cursor(cursor, *types):
+    """encode_cursor 의 역변환. 형식이 틀리면 None (첫 페이지로 취급)."""
+    if not cursor:
+        return None
+    parts = cursor.split(_SEP)
+    if len(parts) != len(types):
+        return None
+    try:
+        return tuple(t.fromisoformat(p) if t in (date, datetime) else t(p) for t, p in zip(types, parts))
+    except ValueError:
+        return None
+
+
+def keyset_page(query, limit, cursor_of):
+    """limit+1 개를 읽어 다음 페이지 존재 여부를 판단하고 Page를 만듭니다.
+
+    query 는 keyset 조건과 정렬이 이미 적용된 상태여야 합니다.
+    """
+    rows = query.limit(limit + 1).all()
+    items = rows[:limit]
+    next_cursor = cursor_of(items[-1]) if len(rows) > limit else None
+    return Page(items, next_cursor)
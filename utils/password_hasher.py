@@ -0,0 +1,128 @@
+# utils/password_hasher.py
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import partial
+
+from flask import current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from exceptions import PasswordHashTimeout
+
+
+_MP_CONTEXT = multiprocessing.get_context('spawn')
+
+
+class PasswordHasher:
+    """비밀번호 해시/검증을 요청 스레드 밖(프로세스 풀)에서 실행합니다.
+
+    - 워커 수만큼만 동시에 계산하고, 대기 중인 작업은 워커 수 × 4 까지만 받음
+    - 슬롯 대기 + 계산이 timeout 초를 넘으면 PasswordHashTimeout
+    - workers=0 이면 호출한 스레드에서 바로 계산 (개발용)
+    풀 프로세스는 spawn 으로 시작합니다. 요청 스레드·DB 커넥션 풀·알림 스레드가 있는 프로세스를 fork 하면
+    다른 스레드가 잡고 있던 락이 잠긴 채 복사되어 자식이 멈출 수 있기 때문입니다.
+    앱 시작 시 start() 로 미리 띄우고, 그 뒤 fork 된 워커 프로세스(gunicorn --preload 등)에서는 처음 쓸 때 새로 만듭니다.
+    """
+
+    def __init__(self, method, workers, timeout):
+        self.method = method
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max(workers, 1) * 4)
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pool_pid = None
+        self._current_prefix = None
+
+    # -------- 단건 (로그인·비밀번호 변경) --------
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, stored_hash, password):
+        return self._run(check_password_hash, stored_hash, password)
+
+    def needs_rehash(self, stored_hash):
+        """저장된 해시의 방식/파라미터(예: 'scrypt:32768:8:1')가 현재 설정과 다르면 True."""
+        if self._current_prefix is None:
+            # 'scrypt' 처럼 줄여 쓴 설정을 werkzeug 가 채우는 기본값까지 포함해 비교하기 위해 한 번 계산
+            self._current_prefix = generate_password_hash('', self.method).split('$', 1)[0]
+        return stored_hash.split('$', 1)[0] != self._current_prefix
+
+    # -------- 대량 (사용자 일괄 등록) --------
+    @contextmanager
+    def batch(self, workers=None):
+        """대량 해시용 임시 프로세스 풀. 로그인용 풀을 막지 않도록 따로 만듭니다.
+
+        yield 하는 hash_many(passwords) 는 같은 순서의 해시 리스트를 반환합니다.
+        """
+        workers = workers or self.workers or os.cpu_count() or 1
+        hash_one = partial(generate_password_hash, method=self.method)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_MP_CONTEXT) as pool:
+            def hash_many(passwords):
+                passwords = list(passwords)
+                return list(pool.map(hash_one, passwords, chunksize=max(1, len(passwords) // (workers * 4))))
+            yield hash_many
+
+    def start(self):
+        """풀과 워커 프로세스를 미리 띄웁니다 (첫 로그인 요청이 프로세스 시작을 기다리지 않도록).
+
+        기다리지 않고 돌아오며, 워커의 임포트는 백그라운드에서 진행됩니다.
+        spawn 된 풀 워커가 `python app.py` 의 메인 모듈을 다시 임포트할 때는 띄우지 않습니다.
+        """
+        if not self.workers or multiprocessing.current_process().name != 'MainProcess':
+            return
+        pool = self._get_pool()
+        for _ in range(self.workers):
+            pool.submit(os.getpid)
+
+    # -------- 내부 --------
+    def _run(self, fn, *args):
+        if not self.workers:
+            return fn(*args)
+
+        deadline = time.monotonic() + self.timeout
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PasswordHashTimeout("비밀번호 처리 대기열이 가득 찼습니다.")
+        try:
+            try:
+                future = self._get_pool().submit(fn, *args)
+            except BrokenProcessPool:
+                # 워커가 죽은 풀은 버리고 한 번 다시 만듦
+                self._reset_pool()
+                future = self._get_pool().submit(fn, *args)
+            try:
+                return future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FuturesTimeout:
+                future.cancel()
+                raise PasswordHashTimeout("비밀번호 처리 시간이 초과되었습니다.")
+        finally:
+            self._slots.release()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None or self._pool_pid != os.getpid():
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=_MP_CONTEXT)
+                self._pool_pid = os.getpid()
+            return self._pool
+
+    def _reset_pool(self):
+        with self._lock:
+            self._pool = None
+
+
+def init_password_hasher(app):
+    hasher = PasswordHasher(app.config['PASSWORD_HASH_METHOD'],
+                            app.config['PASSWORD_HASH_WORKERS'],
+                            app.config['PASSWORD_HASH_TIMEOUT'])
+    app.extensions['password_hasher'] = hasher
+    hasher.start()
+    return hasher
+
+
+def get_password_hasher():
+    return current_app.extensions['password_hasher']
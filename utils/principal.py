@@ -0,0 +1,113 @@
+# utils/principal.py
+"""세션 principal: 로그인 사용자의 (id, 아이디, 파트, 권한 비트, auth_version) 스냅샷.
+
+Flask 세션 쿠키는 SECRET_KEY 로 서명되므로 클라이언트가 내용을 바꿀 수 없고, 인가 판단은 이 스냅샷만으로
+메모리에서 끝납니다. 계정 수정·삭제·비밀번호 초기화 때 users.auth_version 이 올라가면 예전 스냅샷은 거절됩니다.
+
+auth_version 은 프로세스 로컬 레지스트리에서 확인합니다.
+- 같은 프로세스의 변경: 커밋 직후 레지스트리에 반영
+- 다른 워커 프로세스의 변경: 항목이 AUTH_VERSION_TTL 초 지나면 그 사용자 한 명만 다시 조회
+"""
+import threading
+import time
+from collections import namedtuple
+
+from flask import current_app, session
+
+from constants import RoleFlag
+from models import User, db
+from utils.transaction_hooks import on_commit
+
+
+SESSION_KEY = 'principal'
+
+# user_id -> (auth_version, 확인 시각). 삭제된 사용자는 auth_version=None
+_versions = {}
+_versions_lock = threading.Lock()
+
+
+class Principal(namedtuple('Principal', 'user_id username part role_flags auth_version')):
+    __slots__ = ()
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(user.id, user.username, user.part, user.role_flags or 0, user.auth_version)
+
+    def has_role(self, flag):
+        return bool(self.role_flags & flag)
+
+    @property
+    def is_team_leader(self):
+        return self.has_role(RoleFlag.TEAM_LEADER)
+
+    @property
+    def is_part_leader(self):
+        return self.has_role(RoleFlag.PART_LEADER)
+
+    @property
+    def role_names(self):
+        return RoleFlag.to_role_names(self.role_flags)
+
+
+def start_session(user):
+    """로그인 성공 시 세션에 principal 을 넣습니다."""
+    principal = Principal.from_user(user)
+    session[SESSION_KEY] = list(principal)
+    session['username'] = user.username  # 화면 표시용
+    _remember(user.id, user.auth_version)
+    return principal
+
+
+def end_session():
+    session.pop(SESSION_KEY, None)
+    session.pop('username', None)
+
+
+def load_principal():
+    """세션의 principal 을 검증해 반환합니다. 없거나 만료(auth_version 불일치)면 세션을 비우고 None."""
+    data = session.get(SESSION_KEY)
+    if not data:
+        return None
+    try:
+        principal = Principal(*data)
+    except TypeError:
+        end_session()
+        return None
+    if current_auth_version(principal.user_id) != principal.auth_version:
+        end_session()
+        return None
+    return principal
+
+
+def current_auth_version(user_id):
+    ttl = current_app.config['AUTH_VERSION_TTL']
+    now = time.monotonic()
+    with _versions_lock:
+        entry = _versions.get(user_id)
+    if entry is not None and now - entry[1] < ttl:
+        return entry[0]
+    version = db.session.query(User.auth_version).filter(User.id == user_id).scalar()
+    _remember(user_id, version)
+    return version
+
+
+def bump_auth_version(user):
+    """user 의 기존 세션을 모두 무효화합니다 (호출자 트랜잭션이 커밋될 때 반영)."""
+    user.auth_version = (user.auth_version or 1) + 1
+    user_id, version = user.id, user.auth_version
+    on_commit(lambda: _remember(user_id, version))
+
+
+def forget_after_commit(user_id):
+    """삭제된 사용자의 세션을 커밋 직후부터 거절합니다."""
+    on_commit(lambda: forget(user_id))
+
+
+def forget(user_id):
+    """사용자 행이 없어진 것을 확인했을 때 이 프로세스의 다른 세션도 바로 거절하도록 기록합니다."""
+    _remember(user_id, None)
+
+
+def _remember(user_id, version):
+    with _versions_lock:
+        _versions[user_id] = (version, time.monotonic())
@@ -0,0 +1,25 @@
+# utils/transaction_hooks.py
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from models import db
+
+_KEY = 'on_commit_callbacks'
+
+
+def on_commit(callback):
+    """현재 트랜잭션이 커밋된 뒤에 callback 을 실행합니다. 롤백되면 버립니다.
+
+    알림 발행·캐시 무효화처럼 DB 밖의 부수효과를 커밋된 데이터와 맞출 때 사용합니다.
+    """
+    db.session.info.setdefault(_KEY, []).append(callback)
+
+
+@event.listens_for(Session, 'after_commit')
+def _run_callbacks(session):
+    for callback in session.info.pop(_KEY, []):
+        callback()
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_callbacks(session, previous_transaction):
+    session.info.pop(_KEY, None)
@@ -1,13 +1,37 @@
 # utils/vacation_calculator.py
+from calendar import monthrange
 from datetime import date
 
+import numpy as np
+
+from utils.holiday_calendar import get_holiday_calendar
+
+
+HALF_DAY_TYPES = ('am_half_day', 'pm_half_day')
+
+# date.toordinal() 기준 1970-01-01 (datetime64[D] 의 0)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _to_date(value):
+    """date 또는 'YYYY-MM-DD' 문자열 → date."""
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def _to_datetime64(values):
+    """date/문자열 시퀀스 → datetime64[D] 배열. (np.asarray 로 date 객체를 직접 변환하는 것보다 훨씬 빠른 서수 경유)"""
+    if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[D]')
+    ordinals = np.fromiter((_to_date(v).toordinal() for v in values), dtype=np.int64)
+    return (ordinals - _EPOCH_ORDINAL).astype('datetime64[D]')
+
 
 class VacationCalculator:
     @staticmethod
-    def calculate_annual_leave(join_date_str):
-        """입사일 기준으로 연차 개수를 계산합니다."""
-        today = date.today()
-        join_date = date.fromisoformat(join_date_str)
+    def calculate_annual_leave(join_date, as_of=None):
+        """입사일 기준으로 연차 개수를 계산합니다. (as_of: 기준일, 기본값 오늘)"""
+        today = as_of or date.today()
+        join_date = _to_date(join_date)
 
         # 입사일 기준 만 1년 미만일 경우
         if (today - join_date).days < 365:
@@ -26,21 +50,70 @@ class VacationCalculator:
         # 입사 만 1년차일 경우
         else:
             return 15
+
+    @staticmethod
+    def calculate_annual_leave_batch(join_dates, as_of=None):
+        """여러 입사일의 연차 개수를 한 번에 계산합니다 (NumPy datetime64 벡터 연산).
+
+        calculate_annual_leave 와 같은 규칙이며, join_dates 순서대로 정수 배열을 반환합니다.
+        """
+        today = np.datetime64(as_of or date.today(), 'D')
+        joins = _to_datetime64(join_dates)
+
+        def split(days):
+            """datetime64[D] → (연, 월, 일) 정수 배열."""
+            months = days.astype('datetime64[M]')
+            year = months.astype('datetime64[Y]').astype(np.int64) + 1970
+            month = months.astype(np.int64) % 12 + 1
+            day = (days - months).astype(np.int64) + 1
+            return year, month, day
+
+        join_year, join_month, join_day = split(joins)
+        today_year, today_month, today_day = split(today)
+
+        # 만 1년 미만: 만근 개월 수 (최대 12)
+        total_months = (today_year - join_year) * 12 + today_month - join_month
+        total_months = total_months - (today_day < join_day)
+        first_year = np.minimum(total_months, 12)
+
+        # 만 3년차 이상: 15 + (연차 - 3) // 2 + 1
+        year_diff = today_year - join_year
+        senior = 15 + (year_diff - 3) // 2 + 1
+
+        return np.where((today - joins).astype(np.int64) < 365,
+                        first_year,
+                        np.where(year_diff >= 3, senior, 15))
     
     @staticmethod
-    def can_use_annual_leave(join_date_str):
+    def can_use_annual_leave(join_date, as_of=None):
         """3개월 미만 근무자의 연차 사용 가능 여부를 확인합니다."""
-        today = date.today()
-        join_date = date.fromisoformat(join_date_str)
+        today = as_of or date.today()
+        join_date = _to_date(join_date)
         
-        # 3개월 전 날짜 계산
-        three_months_ago = today
-        if today.month >= 3:
-            three_months_ago = three_months_ago.replace(month=today.month - 3)
+        # 3개월 전 날짜 계산 (말일은 해당 월의 마지막 날로 맞춤: 5/31 → 2/28)
+        if today.month > 3:
+            year, month = today.year, today.month - 3
         else:
-            three_months_ago = three_months_ago.replace(
-                year=today.year - 1, 
-                month=today.month + 9
-            )
+            year, month = today.year - 1, today.month + 9
+        three_months_ago = date(year, month, min(today.day, monthrange(year, month)[1]))
         
         return join_date <= three_months_ago
+
+    @staticmethod
+    def leave_days_by_year(vacation_type, start_date, end_date, holiday_calendar=None):
+        """연차 차감 일수(주말·공휴일 제외)를 연차 연도(달력 연도)별로 나눠 {연도: 일수}로 반환합니다.
+
+        holiday_calendar 를 생략하면 앱에 등록된 휴일 달력을 사용합니다.
+        """
+        calendar = holiday_calendar or get_holiday_calendar()
+        if vacation_type in HALF_DAY_TYPES:
+            return {start_date.year: 0.5 if calendar.is_working_day(start_date) else 0}
+        if vacation_type != 'annual':
+            return {}
+
+        days_by_year = {}
+        for year in range(start_date.year, end_date.year + 1):
+            seg_start = max(start_date, date(year, 1, 1))
+            seg_end = min(end_date, date(year, 12, 31))
+            days_by_year[year] = calendar.working_days(seg_start, seg_end)
+        return days_by_year